@@ -107,17 +107,14 @@ class MockSnoozClient(BleakClientWithServiceCache):
         self._command_char_callback: CharNotifyCallback | None = None
         self._services = MagicMock(spec=BleakGATTServiceCollection)
 
-        def mock_char(uuid: str) -> BleakGATTCharacteristic:
-            if uuid not in [
-                MODEL_NUMBER_CHARACTERISTIC,
-                FIRMWARE_REVISION_CHARACTERISTIC,
-                HARDWARE_REVISION_CHARACTERISTIC,
-                SOFTWARE_REVISION_CHARACTERISTIC,
-                MANUFACTURER_NAME_CHARACTERISTIC,
-                READ_STATE_CHARACTERISTIC,
-                WRITE_STATE_CHARACTERISTIC,
-                READ_COMMAND_CHARACTERISTIC,
-            ]:
+        # characteristics are built the first time they're looked up, then reused
+        self._chars_by_uuid: dict[str, BleakGATTCharacteristic] = {}
+
+        def mock_char(uuid: str) -> BleakGATTCharacteristic | None:
+            if (char := self._chars_by_uuid.get(uuid)) is not None:
+                return char
+
+            if uuid not in MOCK_CHARACTERISTICS:
                 raise Exception(f"Unexpected char uuid: {uuid}")
 
             if (
@@ -126,7 +123,10 @@ class MockSnoozClient(BleakClientWithServiceCache):
             ):
                 return None
 
-            return MagicMock(spec=BleakGATTCharacteristic, uuid=uuid)
+            char = self._chars_by_uuid[uuid] = MagicMock(
+                spec=BleakGATTCharacteristic, uuid=uuid
+            )
+            return char
 
         self._services.get_characteristic.side_effect = mock_char
 
@@ -211,12 +211,9 @@ class MockSnoozClient(BleakClientWithServiceCache):
         if char_specifier.uuid == READ_STATE_CHARACTERISTIC:
             return self._get_state_char_data()
 
-        mock_values = {
-            **CHAR_VALUES_BY_MODEL[self._model],
-            MANUFACTURER_NAME_CHARACTERISTIC: "Snooz",
-        }
-
-        return bytearray(mock_values[char_specifier.uuid], "utf-8")
+        return bytearray(
+            READ_VALUES_BY_MODEL[self._model][char_specifier.uuid], "utf-8"
+        )
 
     async def read_gatt_descriptor(self, handle: int, **kwargs: Any) -> bytearray:
         raise NotImplementedError()
@@ -336,6 +333,19 @@ def pack_state(state: SnoozDeviceState) -> bytearray:
     )
 
 
+MOCK_CHARACTERISTICS = frozenset(
+    [
+        MODEL_NUMBER_CHARACTERISTIC,
+        FIRMWARE_REVISION_CHARACTERISTIC,
+        HARDWARE_REVISION_CHARACTERISTIC,
+        SOFTWARE_REVISION_CHARACTERISTIC,
+        MANUFACTURER_NAME_CHARACTERISTIC,
+        READ_STATE_CHARACTERISTIC,
+        WRITE_STATE_CHARACTERISTIC,
+        READ_COMMAND_CHARACTERISTIC,
+    ]
+)
+
 CHAR_VALUES_BY_MODEL = {
     SnoozDeviceModel.ORIGINAL: {
         MODEL_NUMBER_CHARACTERISTIC: "V2",
@@ -356,6 +366,12 @@ CHAR_VALUES_BY_MODEL = {
     },
 }
 
+# values returned by read_gatt_char, built once instead of per read
+READ_VALUES_BY_MODEL = {
+    model: {**values, MANUFACTURER_NAME_CHARACTERISTIC: "Snooz"}
+    for model, values in CHAR_VALUES_BY_MODEL.items()
+}
+
 
 def pack_other_settings(state: SnoozDeviceState) -> bytearray:
     return bytearray([0] * 10) + bytearray(
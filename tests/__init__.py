@@ -1,5 +1,25 @@
 """Unit test package for pysnooz."""
 
+import asyncio
+
+import pytest
+
 from pysnooz.model import SnoozDeviceModel
 
 SUPPORTED_MODELS = [m for m in SnoozDeviceModel if m != SnoozDeviceModel.UNSUPPORTED]
+SUPPORTED_MODEL_PARAMS = pytest.mark.parametrize(
+    "model", SUPPORTED_MODELS, ids=[m.name for m in SUPPORTED_MODELS]
+)
+
+
+async def drain(max_iterations: int = 8) -> None:
+    """Yield to the event loop up to max_iterations times.
+
+    Stops early once every other task is done. While any other task is still
+    pending, including long-lived ones, all max_iterations yields are made.
+    """
+    current = asyncio.current_task()
+    for _ in range(max_iterations):
+        if all(task is current or task.done() for task in asyncio.all_tasks()):
+            return
+        await asyncio.sleep(0)
@@ -1,17 +1,74 @@
 import asyncio
+import inspect
+from contextlib import contextmanager
 from typing import Any, Iterator
 
 import pytest
 from freezegun import freeze_time
 
+from . import drain
 
-@pytest.fixture(scope="function")
-def mock_sleep(monkeypatch: pytest.MonkeyPatch) -> Iterator[Any]:
+# kept before any fixture patches asyncio.sleep
+_real_sleep = asyncio.sleep
+
+
+@contextmanager
+def _fake_sleep(monkeypatch: pytest.MonkeyPatch) -> Iterator[Any]:
     with freeze_time() as freeze:
 
         async def sleep(seconds, loop=None):
             freeze.tick(seconds)
+            # still yield to the loop so other tasks run and cancellation lands
+            await _real_sleep(0)
 
         monkeypatch.setattr(asyncio, "sleep", sleep)
 
         yield freeze
+
+
+@pytest.fixture(scope="module")
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Share one event loop across the tests in a module."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(autouse=True)
+def fail_on_pending_tasks(request: pytest.FixtureRequest) -> Iterator[None]:
+    # sync tests never run on the loop, so don't create one for them
+    if not inspect.iscoroutinefunction(request.function):
+        yield
+        return
+
+    loop: asyncio.AbstractEventLoop = request.getfixturevalue("event_loop")
+    yield
+
+    # tasks that were just cancelled or are finishing up still get to settle
+    loop.run_until_complete(drain())
+
+    pending = asyncio.all_tasks(loop)
+    if not pending:
+        return
+
+    # clean up before failing so the leak doesn't also break the next test
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+    names = ", ".join(sorted(task.get_name() for task in pending))
+    pytest.fail(f"{request.node.nodeid} left tasks running: {names}")
+
+
+@pytest.fixture(scope="function")
+def mock_sleep(monkeypatch: pytest.MonkeyPatch) -> Iterator[Any]:
+    with _fake_sleep(monkeypatch) as freeze:
+        yield freeze
+
+
+@pytest.fixture(scope="module")
+def module_mock_sleep() -> Iterator[Any]:
+    """Same as mock_sleep, but installed once for every test in a module."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        with _fake_sleep(monkeypatch) as freeze:
+            yield freeze
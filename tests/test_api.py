@@ -34,14 +34,12 @@ def mock_api(mock_client: MockSnoozClient) -> SnoozDeviceApi:
     return SnoozDeviceApi(mock_client)
 
 
-@pytest.mark.asyncio
 async def test_properties(mock_api: SnoozDeviceApi) -> None:
     assert mock_api.is_connected is True
     await mock_api.async_disconnect()
     assert mock_api.is_connected is False
 
 
-@pytest.mark.asyncio
 async def test_client_assertions(
     mocker: MockerFixture, mock_client: MockSnoozClient
 ) -> None:
@@ -85,7 +83,6 @@ async def test_client_assertions(
     notify_spy.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_retries_write_errors(
     mocker: MockerFixture, mock_client: MockSnoozClient
 ) -> None:
@@ -104,7 +101,6 @@ async def test_retries_write_errors(
     assert mock_sleep.mock_calls == [call(d) for d in RETRY_SLEEP_DURATIONS[0:4]]
 
 
-@pytest.mark.asyncio
 async def test_raises_write_errors_after_retries_exhausted(
     mocker: MockerFixture, mock_client: MockSnoozClient
 ) -> None:
@@ -118,7 +114,6 @@ async def test_raises_write_errors_after_retries_exhausted(
     assert mock_sleep.mock_calls == [call(d) for d in RETRY_SLEEP_DURATIONS]
 
 
-@pytest.mark.asyncio
 async def test_raises_unknown_write_errors(
     mocker: MockerFixture, mock_client: MockSnoozClient
 ) -> None:
@@ -132,7 +127,6 @@ async def test_raises_unknown_write_errors(
     assert mock_write_gatt_char.call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_brightness_validation(mocker: MockerFixture) -> None:
     mock_client = mocker.MagicMock(autospec=MockSnoozClient)
     api = SnoozDeviceApi(mock_client)
@@ -143,7 +137,6 @@ async def test_brightness_validation(mocker: MockerFixture) -> None:
     mock_client.write_gatt_char.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_volume_validation(mocker: MockerFixture) -> None:
     mock_client = mocker.MagicMock(autospec=MockSnoozClient)
     api = SnoozDeviceApi(mock_client)
@@ -154,7 +147,6 @@ async def test_volume_validation(mocker: MockerFixture) -> None:
     mock_client.write_gatt_char.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_fan_speed_validation(mocker: MockerFixture) -> None:
     mock_client = mocker.MagicMock(autospec=MockSnoozClient)
     api = SnoozDeviceApi(mock_client)
@@ -165,7 +157,6 @@ async def test_fan_speed_validation(mocker: MockerFixture) -> None:
     mock_client.write_gatt_char.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_auto_temp_threshold_validation(mocker: MockerFixture) -> None:
     mock_client = mocker.MagicMock(autospec=MockSnoozClient)
     api = SnoozDeviceApi(mock_client)
@@ -176,7 +167,6 @@ async def test_auto_temp_threshold_validation(mocker: MockerFixture) -> None:
     mock_client.write_gatt_char.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_missing_characteristics(mock_client: MockSnoozClient) -> None:
     api = SnoozDeviceApi()
     api.load_client(mock_client)
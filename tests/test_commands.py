@@ -1,4 +1,3 @@
-import time
 from asyncio import AbstractEventLoop, CancelledError, gather, sleep
 from datetime import datetime, timedelta
 from typing import Awaitable, Callable, Coroutine
@@ -30,6 +29,8 @@ from pysnooz.commands import (
 )
 from pysnooz.model import SnoozDeviceState
 
+from . import drain
+
 AssertCommandTest = Callable[[MagicMock, SnoozCommandData], Awaitable[None]]
 
 
@@ -51,7 +52,6 @@ def assert_command_success(
     return _factory
 
 
-@pytest.mark.asyncio
 async def test_turn_on(
     mocker: MockerFixture, assert_command_success: AssertCommandTest
 ) -> None:
@@ -68,7 +68,6 @@ async def test_turn_on(
     mock_api.async_set_volume.assert_called_once_with(30)
 
 
-@pytest.mark.asyncio
 async def test_turn_off(
     mocker: MockerFixture,
     assert_command_success: AssertCommandTest,
@@ -80,7 +79,6 @@ async def test_turn_off(
     mock_api.async_set_volume.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_turn_light_on(
     mocker: MockerFixture, assert_command_success: AssertCommandTest
 ) -> None:
@@ -95,7 +93,6 @@ async def test_turn_light_on(
     mock_api.async_set_light_brightness.assert_called_once_with(30)
 
 
-@pytest.mark.asyncio
 async def test_set_light_brightness(
     mocker: MockerFixture, assert_command_success: AssertCommandTest
 ) -> None:
@@ -105,7 +102,6 @@ async def test_set_light_brightness(
     mock_api.async_set_light_brightness.assert_called_once_with(5)
 
 
-@pytest.mark.asyncio
 async def test_turn_light_off(
     mocker: MockerFixture,
     assert_command_success: AssertCommandTest,
@@ -116,7 +112,6 @@ async def test_turn_light_off(
     mock_api.async_set_light_brightness.assert_called_once_with(0)
 
 
-@pytest.mark.asyncio
 async def test_enable_night_mode(
     mocker: MockerFixture,
     assert_command_success: AssertCommandTest,
@@ -131,7 +126,6 @@ async def test_enable_night_mode(
     mock_api.async_set_night_mode_enabled.assert_called_once_with(True, 32)
 
 
-@pytest.mark.asyncio
 async def test_disable_night_mode(
     mocker: MockerFixture,
     assert_command_success: AssertCommandTest,
@@ -142,7 +136,6 @@ async def test_disable_night_mode(
     mock_api.async_set_night_mode_enabled.assert_called_once_with(False, ANY)
 
 
-@pytest.mark.asyncio
 async def test_set_volume(
     mocker: MockerFixture,
     assert_command_success: AssertCommandTest,
@@ -154,7 +147,6 @@ async def test_set_volume(
     mock_api.async_set_power.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_turn_fan_on(
     mocker: MockerFixture, assert_command_success: AssertCommandTest
 ) -> None:
@@ -171,7 +163,6 @@ async def test_turn_fan_on(
     mock_api.async_set_fan_speed.assert_called_once_with(30)
 
 
-@pytest.mark.asyncio
 async def test_turn_fan_off(
     mocker: MockerFixture,
     assert_command_success: AssertCommandTest,
@@ -183,7 +174,6 @@ async def test_turn_fan_off(
     mock_api.async_set_fan_speed.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_set_fan_speed(
     mocker: MockerFixture,
     assert_command_success: AssertCommandTest,
@@ -195,7 +185,6 @@ async def test_set_fan_speed(
     mock_api.async_set_fan_power.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_set_auto_temp_enabled(
     mocker: MockerFixture,
     assert_command_success: AssertCommandTest,
@@ -211,7 +200,6 @@ async def test_set_auto_temp_enabled(
     mock_api.async_set_auto_temp_enabled.assert_called_once_with(False)
 
 
-@pytest.mark.asyncio
 async def test_set_temp_target(
     mocker: MockerFixture,
     assert_command_success: AssertCommandTest,
@@ -222,7 +210,6 @@ async def test_set_temp_target(
     mock_api.async_set_auto_temp_threshold.assert_called_once_with(55)
 
 
-@pytest.mark.asyncio
 async def test_get_info(
     mocker: MockerFixture,
     assert_command_success: AssertCommandTest,
@@ -233,7 +220,6 @@ async def test_get_info(
     mock_api.async_get_info.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_turn_on_transition(
     mocker: MockerFixture,
     assert_command_success: AssertCommandTest,
@@ -279,7 +265,6 @@ async def test_turn_on_transition(
     assert mock_api.mock_calls[-1] == call.async_set_volume(target_volume)
 
 
-@pytest.mark.asyncio
 async def test_turn_fan_on_transition(
     mocker: MockerFixture,
     assert_command_success: AssertCommandTest,
@@ -330,7 +315,6 @@ async def test_turn_fan_on_transition(
 AssertCommandSuccess = Callable[[MagicMock, SnoozCommandData], Coroutine]
 
 
-@pytest.mark.asyncio
 async def test_turn_off_transition(
     mocker: MockerFixture,
     assert_command_success: AssertCommandTest,
@@ -360,7 +344,6 @@ async def test_turn_off_transition(
     assert mock_api.mock_calls[-1] == call.async_set_volume(initial_volume)
 
 
-@pytest.mark.asyncio
 async def test_turn_fan_off_transition(
     mocker: MockerFixture,
     assert_command_success: AssertCommandTest,
@@ -390,7 +373,6 @@ async def test_turn_fan_off_transition(
     assert mock_api.mock_calls[-1] == call.async_set_fan_speed(initial_speed)
 
 
-@pytest.mark.asyncio
 async def test_cancel_before_execution(
     mocker: MockerFixture, event_loop: AbstractEventLoop
 ) -> None:
@@ -406,7 +388,6 @@ async def test_cancel_before_execution(
     assert mock_api.call_count == 0
 
 
-@pytest.mark.asyncio
 async def test_cancel_before_execution_awaited(
     mocker: MockerFixture, event_loop: AbstractEventLoop
 ) -> None:
@@ -425,7 +406,6 @@ async def test_cancel_before_execution_awaited(
     assert result.status == SnoozCommandResultStatus.CANCELLED
 
 
-@pytest.mark.asyncio
 async def test_cancel_during_execution(
     mocker: MockerFixture, event_loop: AbstractEventLoop
 ) -> None:
@@ -451,7 +431,6 @@ async def test_cancel_during_execution(
     mock_api.async_set_power.assert_called_once_with(True)
 
 
-@pytest.mark.asyncio
 async def test_raise_on_cancel(
     mocker: MockerFixture, event_loop: AbstractEventLoop
 ) -> None:
@@ -480,7 +459,6 @@ async def test_raise_on_cancel(
     mock_api.async_set_power.assert_called_once_with(True)
 
 
-@pytest.mark.asyncio
 async def test_cancel_during_transition(
     mocker: MockerFixture, event_loop: AbstractEventLoop, mock_sleep: None
 ) -> None:
@@ -512,7 +490,6 @@ async def test_cancel_during_transition(
     assert call.async_set_volume(target_volume) not in mock_api.mock_calls
 
 
-@pytest.mark.asyncio
 async def test_device_unavailable(event_loop: AbstractEventLoop) -> None:
     command = create_command_processor(event_loop, datetime.now(), turn_on())
     command.on_device_unavailable()
@@ -522,7 +499,6 @@ async def test_device_unavailable(event_loop: AbstractEventLoop) -> None:
     assert result.status == SnoozCommandResultStatus.DEVICE_UNAVAILABLE
 
 
-@pytest.mark.asyncio
 async def test_device_unavailable_during_transition(
     mocker: MockerFixture, event_loop: AbstractEventLoop, mock_sleep: None
 ) -> None:
@@ -554,7 +530,6 @@ async def test_device_unavailable_during_transition(
     assert call.async_set_volume(target_volume) not in mock_api.mock_calls
 
 
-@pytest.mark.asyncio
 async def test_device_exception_during_transition(
     mocker: MockerFixture, event_loop: AbstractEventLoop, mock_sleep: None
 ) -> None:
@@ -586,7 +561,6 @@ async def test_device_exception_during_transition(
     assert call.async_set_volume(target_volume) not in mock_api.mock_calls
 
 
-@pytest.mark.asyncio
 async def test_transition_on_resumes_after_disconnection(
     mocker: MockerFixture, event_loop: AbstractEventLoop, mock_sleep: None
 ) -> None:
@@ -619,7 +593,7 @@ async def test_transition_on_resumes_after_disconnection(
             if command.state == CommandProcessorState.IDLE:
                 await command.async_execute(mock_api)
             else:
-                time.sleep(0.1)
+                await drain()
 
     await reconnect_until_complete()
 
@@ -633,7 +607,6 @@ async def test_transition_on_resumes_after_disconnection(
     )
 
 
-@pytest.mark.asyncio
 async def test_transition_off_resumes_after_disconnection(
     mocker: MockerFixture, event_loop: AbstractEventLoop, mock_sleep: None
 ) -> None:
@@ -666,7 +639,7 @@ async def test_transition_off_resumes_after_disconnection(
             if command.state == CommandProcessorState.IDLE:
                 await command.async_execute(mock_api)
             else:
-                time.sleep(0.1)
+                await drain()
 
     await reconnect_until_complete()
 
@@ -683,7 +656,6 @@ async def test_transition_off_resumes_after_disconnection(
     )
 
 
-@pytest.mark.asyncio
 async def test_unhandled_exception(event_loop: AbstractEventLoop) -> None:
     command = create_command_processor(event_loop, datetime.now(), turn_on())
     command.on_unhandled_exception()
@@ -693,7 +665,6 @@ async def test_unhandled_exception(event_loop: AbstractEventLoop) -> None:
     assert result.status == SnoozCommandResultStatus.UNEXPECTED_ERROR
 
 
-@pytest.mark.asyncio
 async def test_unhandled_exception_during_execution(
     mocker: MockerFixture,
     event_loop: AbstractEventLoop,
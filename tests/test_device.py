@@ -3,10 +3,12 @@ from __future__ import annotations
 
 import asyncio
 import re
-from asyncio import AbstractEventLoop
+import sys
+from contextlib import ExitStack
 from datetime import timedelta
-from typing import Any, Callable
-from unittest.mock import MagicMock, call
+from functools import partialmethod
+from typing import Any, Awaitable, Callable, Iterator, cast
+from unittest.mock import MagicMock, patch
 
 import pytest
 from bleak import BleakClient, BleakGATTServiceCollection
@@ -20,6 +22,7 @@ from pysnooz.api import (
 )
 from pysnooz.commands import (
     SnoozCommandData,
+    SnoozCommandResult,
     SnoozCommandResultStatus,
     enable_night_mode,
     set_auto_temp_enabled,
@@ -44,7 +47,100 @@ from pysnooz.device import (
 from pysnooz.model import SnoozAdvertisementData, SnoozDeviceModel, SnoozFirmwareVersion
 from pysnooz.testing import MockSnoozClient
 
-from . import SUPPORTED_MODELS
+from . import SUPPORTED_MODEL_PARAMS, SUPPORTED_MODELS, drain
+
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as async_timeout
+else:
+    from async_timeout import timeout as async_timeout
+
+
+_CONNECTING = SnoozConnectionStatus.CONNECTING
+_CONNECTED = SnoozConnectionStatus.CONNECTED
+_DISCONNECTED = SnoozConnectionStatus.DISCONNECTED
+
+
+# statuses dispatched when every connection attempt fails
+CONNECTIONS_EXHAUSTED_STATUSES = [
+    _CONNECTING,
+    _DISCONNECTED,
+] * MAX_RECONNECTION_ATTEMPTS
+
+# statuses dispatched when an established connection drops and never comes back
+RECONNECTIONS_EXHAUSTED_STATUSES = [
+    _CONNECTING,
+    _CONNECTED,
+    _DISCONNECTED,
+    *CONNECTIONS_EXHAUSTED_STATUSES,
+]
+
+
+# commands are never modified after they're created, so the ones used by
+# many tests are built once
+TURN_ON_VOLUME_26 = turn_on(volume=26)
+TURN_ON_VOLUME_56_OVER_30S = turn_on(volume=56, duration=timedelta(seconds=30))
+TURN_ON_VOLUME_68_OVER_30S = turn_on(volume=68, duration=timedelta(seconds=30))
+
+
+class StatusRecorder:
+    """Records connection statuses in the order they were dispatched."""
+
+    __slots__ = ("seen",)
+
+    def __init__(self) -> None:
+        self.seen: list[SnoozConnectionStatus] = []
+
+    def __call__(self, status: SnoozConnectionStatus) -> None:
+        self.seen.append(status)
+
+
+class CallRecorder:
+    """Records the positional arguments of every call."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[Any, ...]] = []
+
+    def __call__(self, *args: Any) -> None:
+        self.calls.append(args)
+
+
+def assert_last_state_has(on_state_change: CallRecorder, **fields: Any) -> None:
+    """Assert the fields of the last state an on_state_change recorder saw."""
+    assert on_state_change.calls
+    state = on_state_change.calls[-1][0]
+    for name, value in fields.items():
+        assert getattr(state, name) == value
+
+
+def _create_ble_device(model: SnoozDeviceModel) -> BLEDevice:
+    model_name = (
+        MODEL_NAME_BREEZ if model == SnoozDeviceModel.BREEZ else MODEL_NAME_SNOOZ
+    )
+    return BLEDevice("AA:BB:CC:DD:EE:FF", f"{model_name}-EEFF", [], 0)
+
+
+# built once at import, the fixture only looks them up by model
+BLE_DEVICE_BY_MODEL = {model: _create_ble_device(model) for model in SUPPORTED_MODELS}
+
+ADV_DATA_BY_MODEL = {
+    model: SnoozAdvertisementData(
+        model,
+        SnoozFirmwareVersion.V2
+        if model == SnoozDeviceModel.ORIGINAL
+        else SnoozFirmwareVersion.V6,
+        "AABBCCDDEEFF",
+    )
+    for model in SUPPORTED_MODELS
+}
+
+
+def attach(device: SnoozDevice, **handlers: Callable[..., None]) -> None:
+    """Attach each handler to the device event of the same name."""
+    events = device.events
+    for name, handler in handlers.items():
+        setattr(events, name, getattr(events, name) + handler)
 
 
 class SnoozTestFixture:
@@ -53,69 +149,153 @@ class SnoozTestFixture:
         model: SnoozDeviceModel,
         ble_device: BLEDevice,
         adv_data: SnoozAdvertisementData,
-        loop: AbstractEventLoop,
         mock_connect: MagicMock,
-        trigger_disconnect: Callable[[SnoozDevice], None],
-        trigger_temperature: Callable[[SnoozDevice, float], None],
     ):
         self.model = model
         self.ble_device = ble_device
         self.adv_data = adv_data
-        self.loop = loop
         self.mock_connect = mock_connect
-        self.trigger_disconnect = trigger_disconnect
-        self.trigger_temperature = trigger_temperature
+        self.devices: list[SnoozDevice] = []
 
-    def create_device(self) -> SnoozDevice:
-        return SnoozDevice(self.ble_device, self.adv_data, self.loop)
+    def reset(self) -> None:
+        """Forget anything the previous test did with the shared connect mock."""
+        self.mock_connect.reset_mock(return_value=True)
+        self.mock_connect.side_effect = self.get_connected_client
+        self.devices.clear()
 
-    def mock_connection_fails(self) -> None:
-        self.mock_connect.side_effect = DEVICE_UNAVAILABLE_EXCEPTIONS[0](
-            "Connection error for testing device unavailable"
-        )
+    def get_connected_client(
+        self,
+        client_class: type[BleakClient],
+        device: BLEDevice,
+        name: str,
+        disconnected_callback: Callable[[BleakClient], None] | None,
+        max_attempts: int = 0,
+        cached_services: BleakGATTServiceCollection | None = None,
+        ble_device_callback: Callable[[], BLEDevice] | None = None,
+        use_services_cache: bool = False,
+        **kwargs: Any,
+    ) -> MockSnoozClient:
+        # like establish_connection, every connection gets its own client so a
+        # torn down connection can never reach the one that replaced it
+        return MockSnoozClient(device, self.model, disconnected_callback)
 
-    async def assert_command_success(
-        self, device: SnoozDevice, data: SnoozCommandData
-    ) -> None:
-        await self._assert_command_status(
-            device, data, SnoozCommandResultStatus.SUCCESSFUL
-        )
+    # every client is created by get_connected_client above, so cast instead
+    # of paying for an isinstance check each time a test triggers an event
+    def trigger_disconnect(self, target: SnoozDevice) -> None:
+        assert target._api is not None
+        client = cast(MockSnoozClient, target._api._client)
+        client.trigger_disconnect()
 
-    async def assert_command_cancelled(
-        self, device: SnoozDevice, data: SnoozCommandData
-    ) -> None:
-        await self._assert_command_status(
-            device, data, SnoozCommandResultStatus.CANCELLED
-        )
+    def trigger_temperature(self, target: SnoozDevice, temp: float) -> None:
+        assert target._api is not None
+        client = cast(MockSnoozClient, target._api._client)
+        client.trigger_temperature(temp)
 
-    async def assert_command_device_unavailable(
-        self, device: SnoozDevice, data: SnoozCommandData
-    ) -> None:
-        await self._assert_command_status(
-            device, data, SnoozCommandResultStatus.DEVICE_UNAVAILABLE
-        )
+    def create_device(self) -> SnoozDevice:
+        # devices pick up the running loop of the test that creates them
+        device = SnoozDevice(self.ble_device, self.adv_data)
+        self.devices.append(device)
+        return device
+
+    def create_tracked_device(
+        self, **handlers: Callable[..., None]
+    ) -> tuple[SnoozDevice, StatusRecorder]:
+        """Create a device along with a recorder of its connection statuses.
+
+        Any extra handlers are attached to the device events of the same name.
+        """
+        device = self.create_device()
+        recorder = StatusRecorder()
+        attach(device, on_connection_status_change=recorder, **handlers)
+        return device, recorder
+
+    async def wait_idle(self, device: SnoozDevice, timeout: float = 1.0) -> None:
+        """Wait for the device's connection and reconnection tasks to finish."""
+        pending = [
+            task
+            for task in (device._connection_task, device._reconnection_task)
+            if task is not None and not task.done()
+        ]
+        if pending:
+            await asyncio.wait_for(asyncio.wait(pending), timeout)
+
+        # let callbacks scheduled by the finished tasks run
+        await drain()
+
+    async def assert_idle(self) -> None:
+        """Assert every device created by the test finished its background work."""
+        for device in self.devices:
+            await self.wait_idle(device)
 
-    async def assert_command_unexpected_error(
-        self, device: SnoozDevice, data: SnoozCommandData
-    ) -> None:
-        await self._assert_command_status(
-            device, data, SnoozCommandResultStatus.UNEXPECTED_ERROR
+            assert device._connection_task is None or device._connection_task.done()
+            assert (
+                device._reconnection_task is None or device._reconnection_task.done()
+            )
+
+    def mock_connection_fails(self) -> None:
+        self.mock_connect.side_effect = DEVICE_UNAVAILABLE_EXCEPTIONS[0](
+            "Connection error for testing device unavailable"
         )
 
-    async def _assert_command_status(
+    async def assert_command_status(
         self,
         device: SnoozDevice,
         data: SnoozCommandData,
         status: SnoozCommandResultStatus,
-    ) -> None:
+    ) -> SnoozCommandResult:
         result = await device.async_execute_command(data)
-        assert result.status == status
+        assert result.status is status
+        return result
+
+    assert_command_success = partialmethod(
+        assert_command_status, status=SnoozCommandResultStatus.SUCCESSFUL
+    )
+    assert_command_cancelled = partialmethod(
+        assert_command_status, status=SnoozCommandResultStatus.CANCELLED
+    )
+    assert_command_device_unavailable = partialmethod(
+        assert_command_status, status=SnoozCommandResultStatus.DEVICE_UNAVAILABLE
+    )
+    assert_command_unexpected_error = partialmethod(
+        assert_command_status, status=SnoozCommandResultStatus.UNEXPECTED_ERROR
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_reconnection_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    # reconnect on the next loop iteration instead of waiting in real time
+    monkeypatch.setattr("pysnooz.device.RECONNECTION_DELAY_SECONDS", 0)
+
+
+@pytest.fixture(scope="module")
+def module_mock_connect() -> Iterator[MagicMock]:
+    """Patch establish_connection once for the whole module."""
+    with patch("pysnooz.device.establish_connection") as mock_connect:
+        yield mock_connect
+
+
+@pytest.fixture(scope="module")
+def module_snooz_fixtures(
+    module_mock_connect: MagicMock,
+) -> dict[SnoozDeviceModel, SnoozTestFixture]:
+    """Build one test fixture per model and share it across the module."""
+    return {
+        model: SnoozTestFixture(
+            model=model,
+            ble_device=BLE_DEVICE_BY_MODEL[model],
+            adv_data=ADV_DATA_BY_MODEL[model],
+            mock_connect=module_mock_connect,
+        )
+        for model in SUPPORTED_MODELS
+    }
 
 
 @pytest.fixture(scope="function")
 def snooz(
-    request: pytest.FixtureRequest, mocker: MockerFixture, event_loop: AbstractEventLoop
-) -> SnoozTestFixture:
+    request: pytest.FixtureRequest,
+    event_loop: asyncio.AbstractEventLoop,
+    module_snooz_fixtures: dict[SnoozDeviceModel, SnoozTestFixture],
+) -> Iterator[SnoozTestFixture]:
     model = SnoozDeviceModel.ORIGINAL
 
     # if the test is parametrized with a model, use that
@@ -124,277 +304,299 @@ def snooz(
     elif model_marker := request.node.get_closest_marker("model"):
         model = model_marker.args[0]
 
-    model_name = (
-        MODEL_NAME_BREEZ if model == SnoozDeviceModel.BREEZ else MODEL_NAME_SNOOZ
-    )
-    device = BLEDevice("AA:BB:CC:DD:EE:FF", f"{model_name}-EEFF", [], 0)
-    password = "AABBCCDDEEFF"
-    adv_data = SnoozAdvertisementData(
-        model,
-        SnoozFirmwareVersion.V2
-        if model == SnoozDeviceModel.ORIGINAL
-        else SnoozFirmwareVersion.V6,
-        password,
-    )
+    fixture = module_snooz_fixtures[model]
+    fixture.reset()
+    yield fixture
 
-    def get_connected_client(
-        client_class: type[BleakClient],
-        device: BLEDevice,
-        name: str,
-        disconnected_callback: Callable[[BleakClient], None] | None,
-        max_attempts: int = 0,
-        cached_services: BleakGATTServiceCollection | None = None,
-        ble_device_callback: Callable[[], BLEDevice] | None = None,
-        use_services_cache: bool = False,
-        **kwargs: Any,
-    ) -> MockSnoozClient:
-        return MockSnoozClient(device, model, disconnected_callback)
+    # devices must not leave connections or reconnections running for the next test
+    event_loop.run_until_complete(fixture.assert_idle())
 
-    mock_connect = mocker.patch("pysnooz.device.establish_connection", autospec=True)
-    mock_connect.side_effect = get_connected_client
 
-    def trigger_disconnect(target: SnoozDevice) -> None:
-        assert target._api is not None
-        assert isinstance(target._api._client, MockSnoozClient)
-        target._api._client.trigger_disconnect()
+class PatchedApi:
+    def __init__(
+        self,
+        mock_authenticate: MagicMock,
+        mock_clear_cache: MagicMock,
+        mock_disconnect: MagicMock,
+    ):
+        self.mock_authenticate = mock_authenticate
+        self.mock_clear_cache = mock_clear_cache
+        self.mock_disconnect = mock_disconnect
 
-    def trigger_temperature(target: SnoozDevice, temp: float) -> None:
-        assert target._api is not None
-        assert isinstance(target._api._client, MockSnoozClient)
-        target._api._client.trigger_temperature(temp)
-
-    return SnoozTestFixture(
-        model=model,
-        ble_device=device,
-        adv_data=adv_data,
-        loop=event_loop,
-        mock_connect=mock_connect,
-        trigger_disconnect=trigger_disconnect,
-        trigger_temperature=trigger_temperature,
+
+@pytest.fixture(scope="function")
+def patched_api(mocker: MockerFixture) -> PatchedApi:
+    """
+    Patch the connection steps tests commonly intercept.
+    Each mock keeps the original behavior until a test sets its side effect.
+    """
+    return PatchedApi(
+        mock_authenticate=mocker.patch(
+            "pysnooz.device.SnoozDeviceApi.async_authenticate_connection",
+            autospec=True,
+            side_effect=SnoozDeviceApi.async_authenticate_connection,
+        ),
+        mock_clear_cache=mocker.patch("pysnooz.testing.MockSnoozClient.clear_cache"),
+        mock_disconnect=mocker.spy(MockSnoozClient, "disconnect"),
     )
 
 
-def breez() -> SnoozTestFixture:
-    return snooz(SnoozDeviceModel.BREEZ)
+DISPLAY_NAME_PATTERN = re.compile(r"(Snooz|Breez) [A-Z0-9]{4}")
 
 
-def test_display_name(snooz: SnoozTestFixture) -> None:
+async def test_display_name(snooz: SnoozTestFixture) -> None:
     device = snooz.create_device()
-    assert re.search(r"^(Snooz|Breez) [A-Z0-9]{4}$", device.display_name) is not None
+    assert DISPLAY_NAME_PATTERN.fullmatch(device.display_name) is not None
+
+
+BASIC_COMMAND_CASES = [
+    pytest.param([], turn_off(), {"on": False, "volume": 25}, id="turn_off"),
+    pytest.param([], set_volume(36), {"volume": 36}, id="set_volume"),
+    pytest.param(
+        [],
+        set_light_brightness(44),
+        {"light_on": True, "light_brightness": 44, "night_mode_enabled": False},
+        id="set_light_brightness",
+    ),
+    pytest.param(
+        [set_light_brightness(44)],
+        turn_light_off(),
+        {"light_on": False, "light_brightness": 0, "night_mode_enabled": False},
+        id="turn_light_off",
+    ),
+    pytest.param(
+        [],
+        enable_night_mode(80),
+        {
+            "light_on": False,
+            "light_brightness": 0,
+            "night_mode_enabled": True,
+            "night_mode_brightness": 80,
+        },
+        id="enable_night_mode",
+    ),
+]
+
+BREEZ_COMMAND_CASES = [
+    pytest.param([], turn_fan_off(), {"fan_on": False}, id="turn_fan_off"),
+    pytest.param([], set_fan_speed(36), {"fan_speed": 36}, id="set_fan_speed"),
+    pytest.param(
+        [],
+        set_auto_temp_enabled(True),
+        {"fan_auto_enabled": True},
+        id="set_auto_temp_enabled",
+    ),
+    # setting a target also enables auto temp, so enable it first to
+    # isolate the target change to a single state update
+    pytest.param(
+        [set_auto_temp_enabled(True)],
+        set_temp_target(46),
+        {"target_temperature": 46},
+        id="set_temp_target",
+    ),
+]
+
+
+async def _assert_command_updates_state(
+    snooz: SnoozTestFixture,
+    connect_command: SnoozCommandData,
+    setup: list[SnoozCommandData],
+    command: SnoozCommandData,
+    expected: dict[str, Any],
+) -> None:
+    on_state_change = CallRecorder()
+    subscription_callback = CallRecorder()
 
+    device, on_connection_status_change = snooz.create_tracked_device()
+    await snooz.assert_command_success(device, connect_command)
+    for setup_command in setup:
+        await snooz.assert_command_success(device, setup_command)
 
-@pytest.mark.asyncio
-async def test_basic_commands(mocker: MockerFixture, snooz: SnoozTestFixture) -> None:
-    on_connection_status_change = mocker.stub()
-    on_state_change = mocker.stub()
-    subscription_callback = mocker.stub()
+    on_connection_status_change.seen.clear()
+    attach(device, on_state_change=on_state_change)
+    device.subscribe_to_state_change(subscription_callback)
 
-    device = snooz.create_device()
+    await snooz.assert_command_success(device, command)
+    assert len(on_state_change.calls) == 1
+    assert len(subscription_callback.calls) == 1
+    # no other status changes should have occurred
+    assert not on_connection_status_change.seen
+    assert_last_state_has(on_state_change, **expected)
+    for name, value in expected.items():
+        assert getattr(device.state, name) == value
 
-    device.events.on_state_change += on_state_change
-    device.events.on_connection_status_change += on_connection_status_change
+
+@pytest.mark.parametrize("setup, command, expected", BASIC_COMMAND_CASES)
+async def test_basic_command(
+    snooz: SnoozTestFixture,
+    setup: list[SnoozCommandData],
+    command: SnoozCommandData,
+    expected: dict[str, Any],
+) -> None:
+    await _assert_command_updates_state(
+        snooz, turn_on(volume=25), setup, command, expected
+    )
+
+
+@pytest.mark.model(SnoozDeviceModel.BREEZ)
+@pytest.mark.parametrize("setup, command, expected", BREEZ_COMMAND_CASES)
+async def test_breez_command(
+    snooz: SnoozTestFixture,
+    setup: list[SnoozCommandData],
+    command: SnoozCommandData,
+    expected: dict[str, Any],
+) -> None:
+    await _assert_command_updates_state(
+        snooz, turn_fan_on(speed=25), setup, command, expected
+    )
+
+
+async def test_basic_commands(snooz: SnoozTestFixture) -> None:
+    on_state_change = CallRecorder()
+    subscription_callback = CallRecorder()
+
+    device, on_connection_status_change = snooz.create_tracked_device(
+        on_state_change=on_state_change
+    )
 
     unsubscribe = device.subscribe_to_state_change(subscription_callback)
 
     # events should not occur until the device is connected
-    on_connection_status_change.assert_not_called()
-    on_state_change.assert_not_called()
-    subscription_callback.assert_not_called()
+    assert not on_connection_status_change.seen
+    assert not on_state_change.calls
+    assert not subscription_callback.calls
 
     await snooz.assert_command_success(device, turn_on(volume=25))
     assert device.state.on is True
     assert device.state.volume == 25
-    assert on_connection_status_change.mock_calls == (
-        [call(SnoozConnectionStatus.CONNECTING), call(SnoozConnectionStatus.CONNECTED)]
-    )
-    on_connection_status_change.reset_mock()
+    assert on_connection_status_change.seen == [_CONNECTING, _CONNECTED]
+    on_connection_status_change.seen.clear()
 
     # for api simplicity, you can set the volume and power state in one command, but it
     # translates to two ble char writes
-    assert on_state_change.call_count == 2
-    on_state_change.reset_mock()
+    assert len(on_state_change.calls) == 2
+    on_state_change.calls.clear()
 
     # two connection status changes, two state changes
-    assert subscription_callback.call_count == 4
-    subscription_callback.reset_mock()
+    assert len(subscription_callback.calls) == 4
+    subscription_callback.calls.clear()
 
     await snooz.assert_command_success(device, turn_off())
-    assert device.state.on is False
-    assert on_state_change.mock_calls[0].args[0].on is False
-    assert on_state_change.mock_calls[0].args[0].volume == 25
-    on_state_change.reset_mock()
-    subscription_callback.assert_called_once()
-    subscription_callback.reset_mock()
-
-    await snooz.assert_command_success(device, set_volume(36))
-    assert device.state.volume == 36
-    assert on_state_change.mock_calls[0].args[0].volume == 36
-    on_state_change.reset_mock()
-    subscription_callback.assert_called_once()
-    subscription_callback.reset_mock()
-
-    await snooz.assert_command_success(device, set_light_brightness(44))
-    assert device.state.light_on is True
-    assert device.state.light_brightness == 44
-    assert device.state.night_mode_enabled is False
-    on_state_change.assert_called_once()
-    assert on_state_change.mock_calls[0].args[0].light_brightness == 44
-    on_state_change.reset_mock()
-    subscription_callback.assert_called_once()
-    subscription_callback.reset_mock()
-
-    await snooz.assert_command_success(device, turn_light_off())
-    assert device.state.light_on is False
-    assert device.state.light_brightness == 0
-    assert device.state.night_mode_enabled is False
-    on_state_change.assert_called_once()
-    assert on_state_change.mock_calls[0].args[0].light_on is False
-    assert on_state_change.mock_calls[0].args[0].light_brightness == 0
-    assert on_state_change.mock_calls[0].args[0].night_mode_enabled is False
-    on_state_change.reset_mock()
-    subscription_callback.assert_called_once()
-    subscription_callback.reset_mock()
-
-    await snooz.assert_command_success(device, enable_night_mode(80))
-    assert device.state.light_on is False
-    assert device.state.light_brightness == 0
-    assert device.state.night_mode_enabled is True
-    assert device.state.night_mode_brightness == 80
-    on_state_change.assert_called_once()
-    assert on_state_change.mock_calls[0].args[0].night_mode_enabled is True
-    assert on_state_change.mock_calls[0].args[0].night_mode_brightness == 80
-    on_state_change.reset_mock()
-    subscription_callback.assert_called_once()
-    subscription_callback.reset_mock()
+    assert len(on_state_change.calls) == 1
+    assert len(subscription_callback.calls) == 1
+    subscription_callback.calls.clear()
 
     # no other status changes should have occurred
-    on_connection_status_change.assert_not_called()
+    assert not on_connection_status_change.seen
 
     # when unsubscribe is called, the callback should stop being called
     unsubscribe()
 
     await snooz.assert_command_success(device, turn_on(99))
-    subscription_callback.assert_not_called()
-
-    await snooz.assert_command_success(device, turn_off())
-    subscription_callback.assert_not_called()
-
-    await snooz.assert_command_success(device, set_volume(15))
-    subscription_callback.assert_not_called()
+    assert not subscription_callback.calls
 
-    await snooz.assert_command_success(device, turn_light_on())
-    subscription_callback.assert_not_called()
 
-    await snooz.assert_command_success(device, set_light_brightness(65))
-    subscription_callback.assert_not_called()
-
-    await snooz.assert_command_success(device, enable_night_mode())
-    subscription_callback.assert_not_called()
-
-
-@pytest.mark.asyncio
 @pytest.mark.model(SnoozDeviceModel.BREEZ)
-async def test_breez_commands(mocker: MockerFixture, snooz: SnoozTestFixture) -> None:
-    on_connection_status_change = mocker.stub()
-    on_state_change = mocker.stub()
-    subscription_callback = mocker.stub()
-
-    device = snooz.create_device()
+async def test_breez_commands(snooz: SnoozTestFixture) -> None:
+    on_state_change = CallRecorder()
+    subscription_callback = CallRecorder()
 
-    device.events.on_state_change += on_state_change
-    device.events.on_connection_status_change += on_connection_status_change
+    device, on_connection_status_change = snooz.create_tracked_device(
+        on_state_change=on_state_change
+    )
 
     unsubscribe = device.subscribe_to_state_change(subscription_callback)
 
     # events should not occur until the device is connected
-    on_connection_status_change.assert_not_called()
-    on_state_change.assert_not_called()
-    subscription_callback.assert_not_called()
+    assert not on_connection_status_change.seen
+    assert not on_state_change.calls
+    assert not subscription_callback.calls
 
     await snooz.assert_command_success(device, turn_fan_on(speed=25))
     assert device.state.fan_on is True
     assert device.state.fan_speed == 25
-    assert on_connection_status_change.mock_calls == (
-        [call(SnoozConnectionStatus.CONNECTING), call(SnoozConnectionStatus.CONNECTED)]
-    )
-    on_connection_status_change.reset_mock()
+    assert on_connection_status_change.seen == [_CONNECTING, _CONNECTED]
+    on_connection_status_change.seen.clear()
 
     # for api simplicity, you can set the fan speed and power state in one command,
     # but it translates to two ble char writes
-    assert on_state_change.call_count == 2
-    on_state_change.reset_mock()
+    assert len(on_state_change.calls) == 2
+    on_state_change.calls.clear()
 
     # two connection status changes, two state changes
-    assert subscription_callback.call_count == 4
-    subscription_callback.reset_mock()
-
-    await snooz.assert_command_success(device, turn_fan_off())
-    assert device.state.fan_on is False
-    on_state_change.assert_called_once()
-    assert on_state_change.mock_calls[0].args[0].fan_on is False
-    on_state_change.reset_mock()
-    subscription_callback.assert_called_once()
-    subscription_callback.reset_mock()
-
-    await snooz.assert_command_success(device, set_fan_speed(36))
-    assert device.state.fan_speed == 36
-    on_state_change.assert_called_once()
-    assert on_state_change.mock_calls[0].args[0].fan_speed == 36
-    on_state_change.reset_mock()
-    subscription_callback.assert_called_once()
-    subscription_callback.reset_mock()
-
-    await snooz.assert_command_success(device, set_auto_temp_enabled(True))
-    assert device.state.fan_auto_enabled is True
-    on_state_change.assert_called_once()
-    assert on_state_change.mock_calls[0].args[0].fan_auto_enabled is True
-    on_state_change.reset_mock()
-    subscription_callback.assert_called_once()
-    subscription_callback.reset_mock()
-
-    await snooz.assert_command_success(device, set_temp_target(46))
-    assert device.state.target_temperature == 46
-    on_state_change.assert_called_once()
-    assert on_state_change.mock_calls[0].args[0].target_temperature == 46
-    on_state_change.reset_mock()
-    subscription_callback.assert_called_once()
-    subscription_callback.reset_mock()
+    assert len(subscription_callback.calls) == 4
+    subscription_callback.calls.clear()
 
     snooz.trigger_temperature(device, 75)
     assert device.state.temperature == 75
-    on_state_change.assert_called_once()
-    assert on_state_change.mock_calls[0].args[0].temperature == 75
-    on_state_change.reset_mock()
-    subscription_callback.assert_called_once()
-    subscription_callback.reset_mock()
+    assert len(on_state_change.calls) == 1
+    assert_last_state_has(on_state_change, temperature=75)
+    on_state_change.calls.clear()
+    assert len(subscription_callback.calls) == 1
+    subscription_callback.calls.clear()
 
     # no other status changes should have occurred
-    on_connection_status_change.assert_not_called()
+    assert not on_connection_status_change.seen
 
     # when unsubscribe is called, the callback should stop being called
     unsubscribe()
 
     await snooz.assert_command_success(device, turn_fan_on(99))
-    subscription_callback.assert_not_called()
-
-    await snooz.assert_command_success(device, turn_fan_off())
-    subscription_callback.assert_not_called()
+    assert not subscription_callback.calls
+
+
+_ORIGINAL = SnoozDeviceModel.ORIGINAL
+_BREEZ = SnoozDeviceModel.BREEZ
+
+
+@pytest.mark.parametrize(
+    ("model", "connect_command", "command"),
+    [
+        pytest.param(_ORIGINAL, TURN_ON_VOLUME_26, turn_off(), id="turn_off"),
+        pytest.param(_ORIGINAL, TURN_ON_VOLUME_26, set_volume(15), id="set_volume"),
+        pytest.param(_ORIGINAL, TURN_ON_VOLUME_26, turn_light_on(), id="light_on"),
+        pytest.param(
+            _ORIGINAL,
+            TURN_ON_VOLUME_26,
+            set_light_brightness(65),
+            id="light_brightness",
+        ),
+        pytest.param(
+            _ORIGINAL, TURN_ON_VOLUME_26, enable_night_mode(), id="night_mode"
+        ),
+        pytest.param(_BREEZ, turn_fan_on(speed=25), turn_fan_off(), id="fan_off"),
+        pytest.param(_BREEZ, turn_fan_on(speed=25), set_fan_speed(15), id="fan_speed"),
+        pytest.param(
+            _BREEZ, turn_fan_on(speed=25), set_auto_temp_enabled(True), id="auto_temp"
+        ),
+        pytest.param(
+            _BREEZ, turn_fan_on(speed=25), set_temp_target(64), id="temp_target"
+        ),
+    ],
+)
+async def test_commands_after_unsubscribe(
+    snooz: SnoozTestFixture,
+    model: SnoozDeviceModel,
+    connect_command: SnoozCommandData,
+    command: SnoozCommandData,
+) -> None:
+    subscription_callback = CallRecorder()
 
-    await snooz.assert_command_success(device, set_fan_speed(15))
-    subscription_callback.assert_not_called()
+    device = snooz.create_device()
+    unsubscribe = device.subscribe_to_state_change(subscription_callback)
+    await snooz.assert_command_success(device, connect_command)
+    assert subscription_callback.calls
 
-    await snooz.assert_command_success(device, set_auto_temp_enabled(True))
-    subscription_callback.assert_not_called()
+    # when unsubscribe is called, the callback should stop being called
+    unsubscribe()
+    subscription_callback.calls.clear()
 
-    await snooz.assert_command_success(device, set_temp_target(64))
-    subscription_callback.assert_not_called()
+    await snooz.assert_command_success(device, command)
+    assert not subscription_callback.calls
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("model", SUPPORTED_MODELS)
-async def test_device_info(
-    mocker: MockerFixture, snooz: SnoozTestFixture, model: SnoozDeviceModel
-) -> None:
+@SUPPORTED_MODEL_PARAMS
+async def test_device_info(snooz: SnoozTestFixture, model: SnoozDeviceModel) -> None:
     device = snooz.create_device()
 
     info = await device.async_get_info()
@@ -410,29 +612,24 @@ async def test_device_info(
         assert info.software is not None
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("model", SUPPORTED_MODELS)
+@SUPPORTED_MODEL_PARAMS
 async def test_cancel_device_info(
     snooz: SnoozTestFixture, model: SnoozDeviceModel
 ) -> None:
     device = snooz.create_device()
 
-    async def takes_a_second(*args, **kwargs):
-        await asyncio.sleep(1)
+    async def never_returns(*args, **kwargs):
+        await asyncio.get_running_loop().create_future()
 
-    snooz.mock_connect.side_effect = takes_a_second
+    snooz.mock_connect.side_effect = never_returns
 
     with pytest.raises(asyncio.TimeoutError):
-        await asyncio.wait_for(device.async_get_info(), timeout=0.1)
-
-
-@pytest.mark.asyncio
-async def test_auto_reconnect(mocker: MockerFixture, snooz: SnoozTestFixture) -> None:
-    on_connection_change = mocker.stub()
+        async with async_timeout(0.1):
+            await device.async_get_info()
 
-    device = snooz.create_device()
 
-    device.events.on_connection_status_change += on_connection_change
+async def test_auto_reconnect(snooz: SnoozTestFixture) -> None:
+    device, on_connection_change = snooz.create_tracked_device()
 
     await snooz.assert_command_success(device, turn_on())
     assert device.is_connected
@@ -440,37 +637,32 @@ async def test_auto_reconnect(mocker: MockerFixture, snooz: SnoozTestFixture) ->
     snooz.trigger_disconnect(device)
     assert not device.is_connected
 
-    # wait for the reconnection task to complete
-    await asyncio.wait_for(device._reconnection_task, timeout=1)
+    # reconnecting has no delay in tests, so the bound only matters on a regression
+    assert device._reconnection_task is not None
+    async with async_timeout(1):
+        await device._reconnection_task
 
-    assert on_connection_change.mock_calls == (
+    assert on_connection_change.seen == (
         [
-            call(SnoozConnectionStatus.CONNECTING),
-            call(SnoozConnectionStatus.CONNECTED),
-            call(SnoozConnectionStatus.DISCONNECTED),
-            call(SnoozConnectionStatus.CONNECTING),
-            call(SnoozConnectionStatus.CONNECTED),
+            _CONNECTING,
+            _CONNECTED,
+            _DISCONNECTED,
+            _CONNECTING,
+            _CONNECTED,
         ]
     )
     assert device.is_connected
-    on_connection_change.reset_mock()
+    on_connection_change.seen.clear()
 
     await snooz.assert_command_success(device, set_volume(39))
     assert device.state.volume == 39
 
     # should reuse existing connections
-    on_connection_change.assert_not_called()
+    assert not on_connection_change.seen
 
 
-@pytest.mark.asyncio
-async def test_auto_reconnect_device_unavailable(
-    mocker: MockerFixture, snooz: SnoozTestFixture
-) -> None:
-    on_connection_change = mocker.stub()
-
-    device = snooz.create_device()
-
-    device.events.on_connection_status_change += on_connection_change
+async def test_auto_reconnect_device_unavailable(snooz: SnoozTestFixture) -> None:
+    device, on_connection_change = snooz.create_tracked_device()
 
     await snooz.assert_command_success(device, turn_on())
     assert device.is_connected
@@ -480,99 +672,67 @@ async def test_auto_reconnect_device_unavailable(
     snooz.trigger_disconnect(device)
     assert not device.is_connected
 
-    await asyncio.wait_for(device._connections_exhausted.wait(), timeout=3)
+    async with async_timeout(1):
+        await device._connections_exhausted.wait()
 
-    assert on_connection_change.mock_calls == (
-        [
-            call(SnoozConnectionStatus.CONNECTING),
-            call(SnoozConnectionStatus.CONNECTED),
-            call(SnoozConnectionStatus.DISCONNECTED),
-            *[
-                call(SnoozConnectionStatus.CONNECTING),
-                call(SnoozConnectionStatus.DISCONNECTED),
-            ]
-            * MAX_RECONNECTION_ATTEMPTS,
-        ]
-    )
+    assert on_connection_change.seen == RECONNECTIONS_EXHAUSTED_STATUSES
     assert not device.is_connected
 
 
-@pytest.mark.asyncio
-async def test_manual_disconnect(
-    mocker: MockerFixture, snooz: SnoozTestFixture
-) -> None:
-    on_connection_change = mocker.stub()
-
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_change
+async def test_manual_disconnect(snooz: SnoozTestFixture) -> None:
+    device, on_connection_change = snooz.create_tracked_device()
 
     # should be noop when not connected
     await device.async_disconnect()
 
-    on_connection_change.assert_not_called()
-    on_connection_change.reset_mock()
+    assert not on_connection_change.seen
 
     await snooz.assert_command_success(device, turn_on())
     assert device.is_connected
 
     await device.async_disconnect()
     assert not device.is_connected
-    await asyncio.sleep(0.1)
+    await snooz.wait_idle(device)
 
     assert device._reconnection_task is None
 
-    assert on_connection_change.mock_calls == (
+    assert on_connection_change.seen == (
         [
-            call(SnoozConnectionStatus.CONNECTING),
-            call(SnoozConnectionStatus.CONNECTED),
-            call(SnoozConnectionStatus.DISCONNECTED),
+            _CONNECTING,
+            _CONNECTED,
+            _DISCONNECTED,
         ]
     )
 
 
-@pytest.mark.asyncio
-async def test_establish_connection_exceptions(
-    mocker: MockerFixture, snooz: SnoozTestFixture
-) -> None:
-    for ex in DEVICE_UNAVAILABLE_EXCEPTIONS:
-        await _test_connection_exception(mocker, snooz, ex)
-
-
-async def _test_connection_exception(
-    mocker: MockerFixture, snooz: SnoozTestFixture, connection_exception: type
+@pytest.mark.parametrize(
+    "connection_exception",
+    DEVICE_UNAVAILABLE_EXCEPTIONS,
+    ids=[ex.__name__ for ex in DEVICE_UNAVAILABLE_EXCEPTIONS],
+)
+async def test_establish_connection_exception(
+    snooz: SnoozTestFixture, connection_exception: type
 ) -> None:
     snooz.mock_connect.side_effect = connection_exception()
 
-    on_connection_change = mocker.stub()
-    on_state_change = mocker.stub()
+    on_state_change = CallRecorder()
 
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_change
-    device.events.on_state_change += on_state_change
-
-    await snooz.assert_command_device_unavailable(device, turn_on(volume=26))
-    await asyncio.sleep(0.1)
-    assert (
-        on_connection_change.mock_calls
-        == [
-            call(SnoozConnectionStatus.CONNECTING),
-            call(SnoozConnectionStatus.DISCONNECTED),
-        ]
-        * MAX_RECONNECTION_ATTEMPTS
+    device, on_connection_change = snooz.create_tracked_device(
+        on_state_change=on_state_change
     )
+
+    await snooz.assert_command_device_unavailable(device, TURN_ON_VOLUME_26)
+    await snooz.wait_idle(device)
+    assert on_connection_change.seen == CONNECTIONS_EXHAUSTED_STATUSES
     assert not device.is_connected
     assert device.state.volume != 26
-    on_state_change.assert_not_called()
+    assert not on_state_change.calls
 
 
-@pytest.mark.asyncio
 async def test_write_exception_during_reconnection(
-    mocker: MockerFixture, snooz: SnoozTestFixture
+    snooz: SnoozTestFixture, patched_api: PatchedApi
 ) -> None:
-    mock_authenticate = mocker.patch(
-        "pysnooz.device.SnoozDeviceApi.async_authenticate_connection",
-        autospec=True,
-    )
+    mock_authenticate = patched_api.mock_authenticate
 
     def trigger_disconnect_then_raises(*args, **kwargs):
         if mock_authenticate.call_count == 1:
@@ -582,33 +742,28 @@ async def test_write_exception_during_reconnection(
 
     mock_authenticate.side_effect = trigger_disconnect_then_raises
 
-    on_connection_change = mocker.stub()
-    on_state_change = mocker.stub()
+    on_state_change = CallRecorder()
 
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_change
-    device.events.on_state_change += on_state_change
+    device, on_connection_change = snooz.create_tracked_device(
+        on_state_change=on_state_change
+    )
 
-    await snooz.assert_command_unexpected_error(device, turn_on(volume=26))
-    assert on_connection_change.mock_calls == (
+    await snooz.assert_command_unexpected_error(device, TURN_ON_VOLUME_26)
+    assert on_connection_change.seen == (
         [
-            call(SnoozConnectionStatus.CONNECTING),
-            call(SnoozConnectionStatus.DISCONNECTED),
-            call(SnoozConnectionStatus.CONNECTING),
-            call(SnoozConnectionStatus.DISCONNECTED),
+            _CONNECTING,
+            _DISCONNECTED,
+            _CONNECTING,
+            _DISCONNECTED,
         ]
     )
-    on_state_change.assert_not_called()
+    assert not on_state_change.calls
 
 
-@pytest.mark.asyncio
 async def test_manual_disconnect_during_reconnect(
-    mocker: MockerFixture, snooz: SnoozTestFixture
+    snooz: SnoozTestFixture, patched_api: PatchedApi
 ) -> None:
-    mock_authenticate = mocker.patch(
-        "pysnooz.device.SnoozDeviceApi.async_authenticate_connection",
-        autospec=True,
-    )
+    mock_authenticate = patched_api.mock_authenticate
 
     async def manual_disconnect_before_last_call(*args, **kwargs):
         if mock_authenticate.call_count == MAX_RECONNECTION_ATTEMPTS:
@@ -618,71 +773,49 @@ async def test_manual_disconnect_during_reconnect(
 
     mock_authenticate.side_effect = manual_disconnect_before_last_call
 
-    on_connection_change = mocker.stub()
-    on_state_change = mocker.stub()
-
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_change
-    device.events.on_state_change += on_state_change
+    on_state_change = CallRecorder()
 
-    await snooz.assert_command_cancelled(device, turn_on(volume=26))
-    assert on_connection_change.mock_calls == (
-        [
-            *[
-                call(SnoozConnectionStatus.CONNECTING),
-                call(SnoozConnectionStatus.DISCONNECTED),
-            ]
-            * MAX_RECONNECTION_ATTEMPTS
-        ]
+    device, on_connection_change = snooz.create_tracked_device(
+        on_state_change=on_state_change
     )
-    on_state_change.assert_not_called()
+
+    await snooz.assert_command_cancelled(device, TURN_ON_VOLUME_26)
+    assert on_connection_change.seen == CONNECTIONS_EXHAUSTED_STATUSES
+    assert not on_state_change.calls
 
 
-@pytest.mark.asyncio
 async def test_disconnect_before_ready(
-    mocker: MockerFixture, snooz: SnoozTestFixture
+    monkeypatch: pytest.MonkeyPatch, snooz: SnoozTestFixture
 ) -> None:
     async def disconnects(*args, **kwargs):
         snooz.trigger_disconnect(device)
 
-    mocker.patch(
-        "pysnooz.device.SnoozDeviceApi.async_authenticate_connection", new=disconnects
-    )
+    monkeypatch.setattr(SnoozDeviceApi, "async_authenticate_connection", disconnects)
 
-    on_connection_change = mocker.stub()
-    on_state_change = mocker.stub()
+    on_state_change = CallRecorder()
 
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_change
-    device.events.on_state_change += on_state_change
-
-    await snooz.assert_command_device_unavailable(device, turn_on(volume=26))
-    assert on_connection_change.mock_calls == (
-        [
-            *[
-                call(SnoozConnectionStatus.CONNECTING),
-                call(SnoozConnectionStatus.DISCONNECTED),
-            ]
-            * MAX_RECONNECTION_ATTEMPTS
-        ]
+    device, on_connection_change = snooz.create_tracked_device(
+        on_state_change=on_state_change
     )
+
+    await snooz.assert_command_device_unavailable(device, TURN_ON_VOLUME_26)
+    assert on_connection_change.seen == CONNECTIONS_EXHAUSTED_STATUSES
     assert not device.is_connected
     assert device.state.volume != 26
-    on_state_change.assert_not_called()
+    assert not on_state_change.calls
 
 
-@pytest.mark.asyncio
 async def test_device_disconnect_callback_after_disconnected(
     snooz: SnoozTestFixture,
 ) -> None:
     device = snooz.create_device()
 
-    await snooz.assert_command_success(device, turn_on(volume=26))
+    await snooz.assert_command_success(device, TURN_ON_VOLUME_26)
 
     original_api = device._api
 
     await device.async_disconnect()
-    await asyncio.sleep(0.1)
+    await snooz.wait_idle(device)
 
     # should be a noop
     original_api.events.on_disconnect()  # type: ignore
@@ -696,7 +829,6 @@ async def test_device_disconnect_callback_after_disconnected(
     assert device.state.volume == 27
 
 
-@pytest.mark.asyncio
 async def test_unexpected_error_before_ready(
     mocker: MockerFixture, snooz: SnoozTestFixture
 ) -> None:
@@ -707,44 +839,65 @@ async def test_unexpected_error_before_ready(
         "Expected unhandled exception for testing"
     )
 
-    on_connection_change = mocker.stub()
-    on_state_change = mocker.stub()
+    on_state_change = CallRecorder()
 
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_change
-    device.events.on_state_change += on_state_change
+    device, on_connection_change = snooz.create_tracked_device(
+        on_state_change=on_state_change
+    )
 
-    await snooz.assert_command_unexpected_error(device, turn_on(volume=26))
-    assert on_connection_change.mock_calls == [
-        call(SnoozConnectionStatus.CONNECTING),
-        call(SnoozConnectionStatus.DISCONNECTED),
+    await snooz.assert_command_unexpected_error(device, TURN_ON_VOLUME_26)
+    assert on_connection_change.seen == [
+        _CONNECTING,
+        _DISCONNECTED,
     ]
     assert not device.is_connected
     assert device.state.volume != 26
-    on_state_change.assert_not_called()
+    assert not on_state_change.calls
+
+
+# read before any test patches it
+REAL_ASYNC_SET_VOLUME = SnoozDeviceApi.async_set_volume
+
+
+SetVolume = Callable[[SnoozDeviceApi, int], Awaitable[None]]
+
+
+@pytest.fixture
+def patch_set_volume() -> Iterator[Callable[[SetVolume], None]]:
+    """Replace SnoozDeviceApi.async_set_volume until the test finishes.
+
+    The replacement is passed as new, so patch never builds or autospecs a mock.
+    """
+    with ExitStack() as stack:
+
+        def apply(set_volume: SetVolume) -> None:
+            stack.enter_context(
+                patch.object(SnoozDeviceApi, "async_set_volume", new=set_volume)
+            )
+
+        yield apply
 
 
-@pytest.mark.asyncio
 async def test_unexpected_error_during_execution(
-    mocker: MockerFixture, snooz: SnoozTestFixture, mock_sleep: None
+    patch_set_volume: Callable[[SetVolume], None],
+    snooz: SnoozTestFixture,
+    mock_sleep: None,
 ) -> None:
-    mock_set_volume = mocker.patch(
-        "pysnooz.device.SnoozDeviceApi.async_set_volume",
-        autospec=True,
-    )
-    mock_set_volume.side_effect = Exception("Expected unhandled exception for testing")
+    async def set_volume_raises(api: SnoozDeviceApi, volume: int) -> None:
+        raise Exception("Expected unhandled exception for testing")
 
-    on_connection_change = mocker.stub()
-    on_state_change = mocker.stub()
+    patch_set_volume(set_volume_raises)
 
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_change
-    device.events.on_state_change += on_state_change
+    on_state_change = CallRecorder()
 
-    await snooz.assert_command_unexpected_error(device, turn_on(volume=26))
+    device, on_connection_change = snooz.create_tracked_device(
+        on_state_change=on_state_change
+    )
+
+    await snooz.assert_command_unexpected_error(device, TURN_ON_VOLUME_26)
     assert device.is_connected
     assert device.state.volume != 26
-    on_state_change.assert_not_called()
+    assert not on_state_change.calls
     await snooz.assert_command_unexpected_error(
         device, turn_on(volume=33, duration=timedelta(seconds=13))
     )
@@ -752,13 +905,12 @@ async def test_unexpected_error_during_execution(
     assert device.state.volume != 33
 
     # shouldn't trigger a disconnect
-    assert on_connection_change.mock_calls == [
-        call(SnoozConnectionStatus.CONNECTING),
-        call(SnoozConnectionStatus.CONNECTED),
+    assert on_connection_change.seen == [
+        _CONNECTING,
+        _CONNECTED,
     ]
 
 
-@pytest.mark.asyncio
 async def test_disconnect_before_ready_then_reconnects(
     mocker: MockerFixture, snooz: SnoozTestFixture
 ) -> None:
@@ -774,20 +926,19 @@ async def test_disconnect_before_ready_then_reconnects(
 
     mock_authenticate.side_effect = trigger_disconnect_once
 
-    on_connection_change = mocker.stub()
-    on_state_change = mocker.stub()
+    on_state_change = CallRecorder()
 
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_change
-    device.events.on_state_change += on_state_change
+    device, on_connection_change = snooz.create_tracked_device(
+        on_state_change=on_state_change
+    )
 
-    await snooz.assert_command_success(device, turn_on(volume=26))
-    assert on_connection_change.mock_calls == (
+    await snooz.assert_command_success(device, TURN_ON_VOLUME_26)
+    assert on_connection_change.seen == (
         [
-            call(SnoozConnectionStatus.CONNECTING),
-            call(SnoozConnectionStatus.DISCONNECTED),
-            call(SnoozConnectionStatus.CONNECTING),
-            call(SnoozConnectionStatus.CONNECTED),
+            _CONNECTING,
+            _DISCONNECTED,
+            _CONNECTING,
+            _CONNECTED,
         ]
     )
     assert device.is_connected
@@ -795,21 +946,14 @@ async def test_disconnect_before_ready_then_reconnects(
     assert device.state.volume == 26
 
 
-@pytest.mark.asyncio
 async def test_missing_characteristic_during_connection(
-    mocker: MockerFixture, snooz: SnoozTestFixture
+    mocker: MockerFixture, snooz: SnoozTestFixture, patched_api: PatchedApi
 ) -> None:
     original_get_char = CharacteristicReference.get
     mock_get_char = mocker.patch(
         "pysnooz.api.CharacteristicReference.get",
         autospec=True,
     )
-    mock_clear_cache = mocker.patch(
-        "pysnooz.testing.MockSnoozClient.clear_cache", autospec=True
-    )
-    mock_discconect = mocker.patch(
-        "pysnooz.testing.MockSnoozClient.disconnect", autospec=True
-    )
 
     missing_count = 0
     times_to_be_missing = 2
@@ -823,68 +967,62 @@ async def test_missing_characteristic_during_connection(
 
     mock_get_char.side_effect = get_missing_char
 
-    on_connection_change = mocker.stub()
-    on_state_change = mocker.stub()
-
-    device = snooz.create_device()
+    on_state_change = CallRecorder()
 
-    device.events.on_connection_status_change += on_connection_change
-    device.events.on_state_change += on_state_change
+    device, on_connection_change = snooz.create_tracked_device(
+        on_state_change=on_state_change
+    )
 
-    await snooz.assert_command_success(device, turn_on(volume=26))
-    assert on_connection_change.mock_calls == (
+    await snooz.assert_command_success(device, TURN_ON_VOLUME_26)
+    assert on_connection_change.seen == (
         [
-            call(SnoozConnectionStatus.CONNECTING),
+            _CONNECTING,
             *[
-                call(SnoozConnectionStatus.DISCONNECTED),
-                call(SnoozConnectionStatus.CONNECTING),
+                _DISCONNECTED,
+                _CONNECTING,
             ]
             * times_to_be_missing,
-            call(SnoozConnectionStatus.CONNECTED),
+            _CONNECTED,
         ]
     )
-    assert mock_clear_cache.call_count == times_to_be_missing
-    assert mock_discconect.call_count == times_to_be_missing
+    assert patched_api.mock_clear_cache.call_count == times_to_be_missing
+    assert patched_api.mock_disconnect.call_count == times_to_be_missing
     assert device.is_connected
     assert device.state.on
     assert device.state.volume == 26
 
 
-@pytest.mark.asyncio
 async def test_manual_disconnect_before_ready(
     mocker: MockerFixture, snooz: SnoozTestFixture
 ) -> None:
     mock_authenticate = mocker.patch(
-        "pysnooz.device.SnoozDeviceApi.async_authenticate_connection",
-        autospec=True,
+        "pysnooz.device.SnoozDeviceApi.async_authenticate_connection"
     )
 
-    on_connection_change = mocker.stub()
-    on_state_change = mocker.stub()
+    on_state_change = CallRecorder()
 
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_change
-    device.events.on_state_change += on_state_change
+    device, on_connection_change = snooz.create_tracked_device(
+        on_state_change=on_state_change
+    )
 
     async def trigger_manual_disconnect(*args, **kwargs):
         await device.async_disconnect()
 
     mock_authenticate.side_effect = trigger_manual_disconnect
 
-    await snooz.assert_command_cancelled(device, turn_on(volume=26))
+    await snooz.assert_command_cancelled(device, TURN_ON_VOLUME_26)
 
     # the device should be disconnected without any reconnection attempts
-    assert on_connection_change.mock_calls == [
-        call(SnoozConnectionStatus.CONNECTING),
-        call(SnoozConnectionStatus.DISCONNECTED),
+    assert on_connection_change.seen == [
+        _CONNECTING,
+        _DISCONNECTED,
     ]
 
-    await asyncio.sleep(0.1)
+    await snooz.wait_idle(device)
     assert not device.is_connected
-    on_state_change.assert_not_called()
+    assert not on_state_change.calls
 
 
-@pytest.mark.asyncio
 async def test_disconnect_while_reconnecting_before_ready(
     mocker: MockerFixture, snooz: SnoozTestFixture
 ) -> None:
@@ -894,289 +1032,230 @@ async def test_disconnect_while_reconnecting_before_ready(
         autospec=True,
     )
 
+    disconnects = 0
+
     def trigger_disconnect_twice(*args, **kwargs):
+        nonlocal disconnects
+        disconnects += 1
         snooz.trigger_disconnect(device)
 
-        if mock_authenticate.call_count >= 2:
+        if disconnects >= 2:
             mock_authenticate.side_effect = original_authenticate
 
     mock_authenticate.side_effect = trigger_disconnect_twice
 
-    on_connection_change = mocker.stub()
-    on_state_change = mocker.stub()
+    on_state_change = CallRecorder()
 
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_change
-    device.events.on_state_change += on_state_change
-
-    await snooz.assert_command_success(device, turn_on(volume=26))
-    assert on_connection_change.mock_calls == (
-        [
-            *[
-                call(SnoozConnectionStatus.CONNECTING),
-                call(SnoozConnectionStatus.DISCONNECTED),
-            ]
-            * 2,
-            call(SnoozConnectionStatus.CONNECTING),
-            call(SnoozConnectionStatus.CONNECTED),
-        ]
+    device, on_connection_change = snooz.create_tracked_device(
+        on_state_change=on_state_change
     )
-    await asyncio.sleep(0.1)
-    assert device.is_connected
-    assert device.state.on
-    assert device.state.volume == 26
 
-
-@pytest.mark.asyncio
-async def test_device_disconnects_during_transition(
-    mocker: MockerFixture, snooz: SnoozTestFixture, mock_sleep: None
-) -> None:
-    device = snooz.create_device()
-
-    disconnect_every = 3
-    total_set_volume_calls = 0
-
-    real_async_set_volume = SnoozDeviceApi.async_set_volume
-
-    async def disconnect_occasionally(api: SnoozDeviceApi, volume: int) -> None:
-        nonlocal total_set_volume_calls
-        if total_set_volume_calls % disconnect_every == 0:
-            snooz.trigger_disconnect(device)
-        else:
-            await real_async_set_volume(api, volume)
-
-        total_set_volume_calls += 1
-
-    mocker.patch.object(SnoozDeviceApi, "async_set_volume", new=disconnect_occasionally)
-
-    await snooz.assert_command_success(
-        device, turn_on(volume=56, duration=timedelta(seconds=30))
-    )
-    await asyncio.sleep(0.1)
+    await snooz.assert_command_success(device, TURN_ON_VOLUME_26)
+    assert on_connection_change.seen == [
+        _CONNECTING,
+        _DISCONNECTED,
+        _CONNECTING,
+        _DISCONNECTED,
+        _CONNECTING,
+        _CONNECTED,
+    ]
+    await snooz.wait_idle(device)
     assert device.is_connected
     assert device.state.on
-    assert device.state.volume == 56
-
-
-@pytest.mark.asyncio
-async def test_user_disconnects_during_transition(
-    mocker: MockerFixture, snooz: SnoozTestFixture, mock_sleep: None
-) -> None:
-    device = snooz.create_device()
+    assert device.state.volume == 26
 
-    disconnect_after = 6
-    total_set_volume_calls = 0
 
-    real_async_set_volume = SnoozDeviceApi.async_set_volume
+# well past the number of volume updates made by a 30 second transition
+EVERY_THIRD_CALL = frozenset(range(0, 1000, 3))
 
-    async def user_disconnects_eventually(api: SnoozDeviceApi, volume: int) -> None:
-        nonlocal total_set_volume_calls
-        if total_set_volume_calls == disconnect_after:
-            await device.async_disconnect()
-        else:
-            await real_async_set_volume(api, volume)
 
-        total_set_volume_calls += 1
+async def _device_disconnects(snooz: SnoozTestFixture, device: SnoozDevice) -> None:
+    snooz.trigger_disconnect(device)
 
-    mocker.patch.object(
-        SnoozDeviceApi, "async_set_volume", new=user_disconnects_eventually
-    )
 
-    await snooz.assert_command_cancelled(
-        device, turn_on(volume=56, duration=timedelta(seconds=30))
-    )
-    await asyncio.sleep(0.1)
-    assert not device.is_connected
-    assert device.state.volume != 56
+async def _user_disconnects(snooz: SnoozTestFixture, device: SnoozDevice) -> None:
+    await device.async_disconnect()
 
 
-@pytest.mark.asyncio
-async def test_device_unavailable_during_transition(
-    mocker: MockerFixture, snooz: SnoozTestFixture, mock_sleep: None
+async def _device_becomes_unavailable(
+    snooz: SnoozTestFixture, device: SnoozDevice
 ) -> None:
-    device = snooz.create_device()
-
-    disconnect_after = 4
-    total_set_volume_calls = 0
-
-    real_async_set_volume = SnoozDeviceApi.async_set_volume
-
-    async def device_becomes_unavailable(api: SnoozDeviceApi, volume: int) -> None:
-        nonlocal total_set_volume_calls
-        if total_set_volume_calls == disconnect_after:
-            snooz.mock_connection_fails()
-            snooz.trigger_disconnect(device)
-        else:
-            await real_async_set_volume(api, volume)
-
-        total_set_volume_calls += 1
-
-    mocker.patch.object(SnoozDeviceApi, "async_set_volume", device_becomes_unavailable)
-
-    await snooz.assert_command_device_unavailable(
-        device, turn_on(volume=68, duration=timedelta(seconds=30))
-    )
-    await asyncio.sleep(0.1)
-    assert not device.is_connected
-    assert device.state.volume != 68
+    snooz.mock_connection_fails()
+    snooz.trigger_disconnect(device)
 
 
-@pytest.mark.asyncio
-async def test_manual_disconnect_during_transition(
-    mocker: MockerFixture, snooz: SnoozTestFixture, mock_sleep: None
+def _interrupt_set_volume(
+    patch_set_volume: Callable[[SetVolume], None],
+    snooz: SnoozTestFixture,
+    device: SnoozDevice,
+    interrupt_at: frozenset[int],
+    interrupt: Callable[[SnoozTestFixture, SnoozDevice], Awaitable[None]],
 ) -> None:
-    on_connection_change = mocker.stub()
+    """Run interrupt instead of setting the volume on the calls in interrupt_at."""
+    # a one item list is mutated in place, so the closure needs no nonlocal
+    total_set_volume_calls = [0]
 
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_change
-
-    disconnect_after = 4
-    total_set_volume_calls = 0
-
-    real_async_set_volume = SnoozDeviceApi.async_set_volume
-
-    async def disconnects_manually(api: SnoozDeviceApi, volume: int) -> None:
-        nonlocal total_set_volume_calls
-        if total_set_volume_calls == disconnect_after:
-            await device.async_disconnect()
+    async def interrupted_set_volume(api: SnoozDeviceApi, volume: int) -> None:
+        if total_set_volume_calls[0] in interrupt_at:
+            await interrupt(snooz, device)
         else:
-            await real_async_set_volume(api, volume)
-
-        total_set_volume_calls += 1
-
-    mocker.patch.object(SnoozDeviceApi, "async_set_volume", disconnects_manually)
-
-    await snooz.assert_command_cancelled(
-        device, turn_on(volume=68, duration=timedelta(seconds=30))
-    )
-    assert not device.is_connected
-    assert device.state.volume != 68
-
-    # the device should be disconnected without any reconnection attempts
-    assert on_connection_change.mock_calls == [
-        call(SnoozConnectionStatus.CONNECTING),
-        call(SnoozConnectionStatus.CONNECTED),
-        call(SnoozConnectionStatus.DISCONNECTED),
-    ]
-
-
-@pytest.mark.asyncio
-async def test_command_cancellation_before_connection(
-    mocker: MockerFixture, snooz: SnoozTestFixture
-) -> None:
-    on_connection_status_change = mocker.stub()
-
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_status_change
-
-    async def takes_a_second(*args, **kwargs):
-        await asyncio.sleep(3)
-
-    snooz.mock_connect.side_effect = takes_a_second
-
-    with pytest.raises(asyncio.TimeoutError):
-        await asyncio.wait_for(device.async_execute_command(turn_on()), timeout=1)
-
-    assert not device.is_connected
-    assert on_connection_status_change.mock_calls == [
-        call(SnoozConnectionStatus.CONNECTING),
-        call(SnoozConnectionStatus.DISCONNECTED),
-    ]
-
-
-@pytest.mark.asyncio
-async def test_command_cancellation_during_connection(
-    mocker: MockerFixture, snooz: SnoozTestFixture
+            await REAL_ASYNC_SET_VOLUME(api, volume)
+
+        total_set_volume_calls[0] += 1
+
+    patch_set_volume(interrupted_set_volume)
+
+
+@pytest.mark.parametrize(
+    "interrupt_at, interrupt, command, status, stays_connected, statuses",
+    [
+        pytest.param(
+            EVERY_THIRD_CALL,
+            _device_disconnects,
+            TURN_ON_VOLUME_56_OVER_30S,
+            SnoozCommandResultStatus.SUCCESSFUL,
+            True,
+            None,
+            id="device_disconnects",
+        ),
+        pytest.param(
+            frozenset({6}),
+            _user_disconnects,
+            TURN_ON_VOLUME_56_OVER_30S,
+            SnoozCommandResultStatus.CANCELLED,
+            False,
+            None,
+            id="user_disconnects",
+        ),
+        pytest.param(
+            frozenset({4}),
+            _device_becomes_unavailable,
+            TURN_ON_VOLUME_68_OVER_30S,
+            SnoozCommandResultStatus.DEVICE_UNAVAILABLE,
+            False,
+            None,
+            id="device_unavailable",
+        ),
+        pytest.param(
+            frozenset({4}),
+            _user_disconnects,
+            TURN_ON_VOLUME_68_OVER_30S,
+            SnoozCommandResultStatus.CANCELLED,
+            False,
+            # the device should be disconnected without any reconnection attempts
+            [
+                _CONNECTING,
+                _CONNECTED,
+                _DISCONNECTED,
+            ],
+            id="manual_disconnect",
+        ),
+    ],
+)
+async def test_interrupted_during_transition(
+    patch_set_volume: Callable[[SetVolume], None],
+    snooz: SnoozTestFixture,
+    mock_sleep: None,
+    interrupt_at: frozenset[int],
+    interrupt: Callable[[SnoozTestFixture, SnoozDevice], Awaitable[None]],
+    command: SnoozCommandData,
+    status: SnoozCommandResultStatus,
+    stays_connected: bool,
+    statuses: list[SnoozConnectionStatus] | None,
 ) -> None:
-    mock_authenticate = mocker.patch(
-        "pysnooz.device.SnoozDeviceApi.async_authenticate_connection",
-        autospec=True,
-    )
-
-    on_connection_status_change = mocker.stub()
-
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_status_change
-
-    async def takes_a_second(*args, **kwargs):
-        await asyncio.sleep(3)
+    device, on_connection_change = snooz.create_tracked_device()
 
-    mock_authenticate.side_effect = takes_a_second
+    _interrupt_set_volume(patch_set_volume, snooz, device, interrupt_at, interrupt)
 
-    with pytest.raises(asyncio.TimeoutError):
-        await asyncio.wait_for(device.async_execute_command(turn_on()), timeout=1)
-
-    assert not device.is_connected
-    assert on_connection_status_change.mock_calls == [
-        call(SnoozConnectionStatus.CONNECTING),
-        call(SnoozConnectionStatus.DISCONNECTED),
-    ]
-
-
-@pytest.mark.asyncio
-async def test_command_cancellation_while_connected(
-    mocker: MockerFixture, snooz: SnoozTestFixture
+    await snooz.assert_command_status(device, command, status)
+    await snooz.wait_idle(device)
+    assert device.is_connected == stays_connected
+    if stays_connected:
+        assert device.state.on
+        assert device.state.volume == command.volume
+    else:
+        assert device.state.volume != command.volume
+
+    if statuses is not None:
+        assert on_connection_change.seen == statuses
+
+
+@pytest.mark.parametrize(
+    "slow_target, command, stays_connected",
+    [
+        pytest.param(
+            "pysnooz.device.establish_connection",
+            turn_on(),
+            False,
+            id="before_connection",
+        ),
+        pytest.param(
+            "pysnooz.device.SnoozDeviceApi.async_authenticate_connection",
+            turn_on(),
+            False,
+            id="during_connection",
+        ),
+        pytest.param(
+            "pysnooz.device.SnoozDeviceApi.async_set_power",
+            turn_on(),
+            True,
+            id="while_connected",
+        ),
+        pytest.param(
+            None,
+            turn_on(volume=56, duration=timedelta(seconds=2)),
+            True,
+            id="during_transition",
+        ),
+    ],
+)
+async def test_command_cancellation(
+    mocker: MockerFixture,
+    snooz: SnoozTestFixture,
+    slow_target: str | None,
+    command: SnoozCommandData,
+    stays_connected: bool,
 ) -> None:
-    mock_set_power = mocker.patch(
-        "pysnooz.device.SnoozDeviceApi.async_set_power",
-        autospec=True,
-    )
-    set_power = mocker.stub()
-    on_connection_status_change = mocker.stub()
+    completed = CallRecorder()
 
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_status_change
+    device, on_connection_status_change = snooz.create_tracked_device()
 
     async def takes_a_second(*args, **kwargs):
         await asyncio.sleep(1.5)
-        set_power()
+        completed()
 
-    mock_set_power.side_effect = takes_a_second
+    if slow_target is not None:
+        mocker.patch(slow_target, side_effect=takes_a_second)
 
+    # the timeout lands long before the slow target would finish
     with pytest.raises(asyncio.TimeoutError):
-        await asyncio.wait_for(device.async_execute_command(turn_on()), timeout=1)
+        async with async_timeout(0.1):
+            await device.async_execute_command(command)
 
-    assert device.is_connected
-    assert on_connection_status_change.mock_calls == [
-        call(SnoozConnectionStatus.CONNECTING),
-        call(SnoozConnectionStatus.CONNECTED),
+    assert device.is_connected == stays_connected
+    assert on_connection_status_change.seen == [
+        _CONNECTING,
+        _CONNECTED if stays_connected else _DISCONNECTED,
     ]
-    set_power.assert_not_called()
+    assert not completed.calls
+    if command.volume is not None:
+        assert device.state.volume != command.volume
 
 
-@pytest.mark.asyncio
-async def test_command_cancellation_during_transition(
-    mocker: MockerFixture, snooz: SnoozTestFixture
-) -> None:
-    on_connection_status_change = mocker.stub()
-
-    device = snooz.create_device()
-    device.events.on_connection_status_change += on_connection_status_change
-
-    with pytest.raises(asyncio.TimeoutError):
-        await asyncio.wait_for(
-            device.async_execute_command(
-                turn_on(volume=56, duration=timedelta(seconds=2))
-            ),
-            timeout=1,
-        )
-
-    assert device.is_connected
-    assert on_connection_status_change.mock_calls == [
-        call(SnoozConnectionStatus.CONNECTING),
-        call(SnoozConnectionStatus.CONNECTED),
-    ]
-    assert device.state.volume != 56
-
-
-@pytest.mark.asyncio
 async def test_new_commands_cancel_existing(snooz: SnoozTestFixture) -> None:
     device = snooz.create_device()
 
-    await asyncio.gather(
-        snooz.assert_command_cancelled(device, turn_on()),
-        snooz.assert_command_success(device, set_volume(99)),
-    )
+    if sys.version_info >= (3, 11):
+        async with asyncio.TaskGroup() as group:
+            group.create_task(snooz.assert_command_cancelled(device, turn_on()))
+            group.create_task(snooz.assert_command_success(device, set_volume(99)))
+    else:
+        await asyncio.gather(
+            snooz.assert_command_cancelled(device, turn_on()),
+            snooz.assert_command_success(device, set_volume(99)),
+        )
 
-    await asyncio.sleep(0.1)
-    assert device.state.volume == 99
+    # wait on the volume itself rather than for the device to go idle
+    async with async_timeout(1):
+        while device.state.volume != 99:
+            await asyncio.sleep(0)
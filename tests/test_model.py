@@ -1,108 +1,124 @@
-from pysnooz.model import SnoozDeviceState, UnknownSnoozState
+import pytest
 
+from pysnooz.model import SnoozDeviceState, UnknownSnoozState
 
-def test_state_operators() -> None:
-    assert SnoozDeviceState(on=True, volume=None) == SnoozDeviceState(
-        on=True, volume=None
-    )
-    assert SnoozDeviceState(on=False, volume=None) == SnoozDeviceState(
-        on=False, volume=None
-    )
-    assert SnoozDeviceState(on=True, volume=10) == SnoozDeviceState(on=True, volume=10)
-    assert SnoozDeviceState(on=False, volume=13) == SnoozDeviceState(
-        on=False, volume=13
-    )
-    assert SnoozDeviceState(on=False, volume=13) != SnoozDeviceState(
-        on=False, volume=15
-    )
+NOISE_OFF_AT_13 = SnoozDeviceState(on=False, volume=13)
+FAN_OFF_AT_13 = SnoozDeviceState(fan_on=False, fan_speed=13)
+LIGHT_AT_15 = SnoozDeviceState(light_on=True, light_brightness=15)
+EVERYTHING_ON = SnoozDeviceState(
+    on=True,
+    volume=50,
+    fan_on=True,
+    fan_speed=60,
+    fan_auto_enabled=True,
+    temperature=64.5,
+    target_temperature=32,
+)
 
-    assert SnoozDeviceState(fan_on=True, fan_speed=None) == SnoozDeviceState(
-        fan_on=True, fan_speed=None
-    )
-    assert SnoozDeviceState(fan_on=False, fan_speed=None) == SnoozDeviceState(
-        fan_on=False, fan_speed=None
-    )
-    assert SnoozDeviceState(fan_on=True, fan_speed=10) == SnoozDeviceState(
-        fan_on=True, fan_speed=10
-    )
-    assert SnoozDeviceState(fan_on=False, fan_speed=13) == SnoozDeviceState(
-        fan_on=False, fan_speed=13
-    )
-    assert SnoozDeviceState(fan_on=False, fan_speed=13) != SnoozDeviceState(
-        fan_on=False, fan_speed=15
-    )
-    assert SnoozDeviceState(light_on=True, light_brightness=15) == SnoozDeviceState(
-        light_on=True, light_brightness=15
-    )
-    assert SnoozDeviceState(light_on=True, light_brightness=15) != SnoozDeviceState(
-        light_on=True, light_brightness=None
-    )
 
-    assert SnoozDeviceState(
-        on=True,
-        volume=50,
-        fan_on=True,
-        fan_speed=60,
-        fan_auto_enabled=True,
-        temperature=64.5,
-        target_temperature=32,
-    ) == SnoozDeviceState(
-        on=True,
-        volume=50,
-        fan_on=True,
-        fan_speed=60,
-        fan_auto_enabled=True,
-        temperature=64.5,
-        target_temperature=32,
-    )
+@pytest.mark.parametrize(
+    "a, b, equal",
+    [
+        (
+            SnoozDeviceState(on=True, volume=None),
+            SnoozDeviceState(on=True, volume=None),
+            True,
+        ),
+        (
+            SnoozDeviceState(on=False, volume=None),
+            SnoozDeviceState(on=False, volume=None),
+            True,
+        ),
+        (
+            SnoozDeviceState(on=True, volume=10),
+            SnoozDeviceState(on=True, volume=10),
+            True,
+        ),
+        (NOISE_OFF_AT_13, SnoozDeviceState(on=False, volume=13), True),
+        (NOISE_OFF_AT_13, SnoozDeviceState(on=False, volume=15), False),
+        (
+            SnoozDeviceState(fan_on=True, fan_speed=None),
+            SnoozDeviceState(fan_on=True, fan_speed=None),
+            True,
+        ),
+        (
+            SnoozDeviceState(fan_on=False, fan_speed=None),
+            SnoozDeviceState(fan_on=False, fan_speed=None),
+            True,
+        ),
+        (
+            SnoozDeviceState(fan_on=True, fan_speed=10),
+            SnoozDeviceState(fan_on=True, fan_speed=10),
+            True,
+        ),
+        (FAN_OFF_AT_13, SnoozDeviceState(fan_on=False, fan_speed=13), True),
+        (FAN_OFF_AT_13, SnoozDeviceState(fan_on=False, fan_speed=15), False),
+        (LIGHT_AT_15, SnoozDeviceState(light_on=True, light_brightness=15), True),
+        (LIGHT_AT_15, SnoozDeviceState(light_on=True, light_brightness=None), False),
+        (
+            EVERYTHING_ON,
+            SnoozDeviceState(
+                on=True,
+                volume=50,
+                fan_on=True,
+                fan_speed=60,
+                fan_auto_enabled=True,
+                temperature=64.5,
+                target_temperature=32,
+            ),
+            True,
+        ),
+    ],
+)
+def test_state_operators(a: SnoozDeviceState, b: SnoozDeviceState, equal: bool) -> None:
+    assert (a == b) is equal
+    assert (a != b) is not equal
 
 
-def test_repr() -> None:
-    assert UnknownSnoozState.__repr__() == "Snooz(Unknown)"
-    assert (
-        SnoozDeviceState(on=True, volume=10).__repr__()
-        == "Snooz(Noise On at 10% volume)"
-    )
-    assert (
-        SnoozDeviceState(on=False, volume=15).__repr__()
-        == "Snooz(Noise Off at 15% volume)"
-    )
-    assert (
-        SnoozDeviceState(
-            on=False, volume=15, light_on=True, light_brightness=55
-        ).__repr__()
-        == "Snooz(Noise Off at 15% volume, Light is 55%)"
-    )
-    assert (
-        SnoozDeviceState(on=False, volume=15, night_mode_enabled=True).__repr__()
-        == "Snooz(Noise Off at 15% volume, [NightMode])"
-    )
-    assert (
-        SnoozDeviceState(
-            on=False, volume=15, night_mode_enabled=True, night_mode_brightness=15
-        ).__repr__()
-        == "Snooz(Noise Off at 15% volume, [NightMode(15%)])"
-    )
-    assert (
-        SnoozDeviceState(on=False, volume=15, fan_on=True, fan_speed=32).__repr__()
-        == "Snooz(Noise Off at 15% volume, Fan On at 32% speed)"
-    )
-    assert (
-        SnoozDeviceState(
-            on=False, volume=15, fan_on=True, fan_speed=32, temperature=70
-        ).__repr__()
-        == "Snooz(Noise Off at 15% volume, Fan On at 32% speed, 70°F)"
-    )
-    assert (
-        SnoozDeviceState(
-            on=False,
-            volume=15,
-            fan_on=True,
-            fan_speed=32,
-            temperature=63.3,
-            fan_auto_enabled=True,
-            target_temperature=72,
-        ).__repr__()
-        == "Snooz(Noise Off at 15% volume, Fan On at 32% speed [Auto]"
-        ", 63.3°F, 72°F target)"
-    )
+@pytest.mark.parametrize(
+    "state, expected",
+    [
+        (UnknownSnoozState, "Snooz(Unknown)"),
+        (SnoozDeviceState(on=True, volume=10), "Snooz(Noise On at 10% volume)"),
+        (SnoozDeviceState(on=False, volume=15), "Snooz(Noise Off at 15% volume)"),
+        (
+            SnoozDeviceState(on=False, volume=15, light_on=True, light_brightness=55),
+            "Snooz(Noise Off at 15% volume, Light is 55%)",
+        ),
+        (
+            SnoozDeviceState(on=False, volume=15, night_mode_enabled=True),
+            "Snooz(Noise Off at 15% volume, [NightMode])",
+        ),
+        (
+            SnoozDeviceState(
+                on=False, volume=15, night_mode_enabled=True, night_mode_brightness=15
+            ),
+            "Snooz(Noise Off at 15% volume, [NightMode(15%)])",
+        ),
+        (
+            SnoozDeviceState(on=False, volume=15, fan_on=True, fan_speed=32),
+            "Snooz(Noise Off at 15% volume, Fan On at 32% speed)",
+        ),
+        (
+            SnoozDeviceState(
+                on=False, volume=15, fan_on=True, fan_speed=32, temperature=70
+            ),
+            "Snooz(Noise Off at 15% volume, Fan On at 32% speed, 70°F)",
+        ),
+        (
+            SnoozDeviceState(
+                on=False,
+                volume=15,
+                fan_on=True,
+                fan_speed=32,
+                temperature=63.3,
+                fan_auto_enabled=True,
+                target_temperature=72,
+            ),
+            "Snooz(Noise Off at 15% volume, Fan On at 32% speed [Auto]"
+            ", 63.3°F, 72°F target)",
+        ),
+    ],
+)
+def test_repr(state: SnoozDeviceState, expected: str) -> None:
+    assert state.__repr__() == expected
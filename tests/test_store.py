@@ -1,3 +1,5 @@
+import pytest
+
 from pysnooz import SnoozDeviceState
 from pysnooz.model import SnoozAdvertisementData, SnoozDeviceModel, SnoozFirmwareVersion
 from pysnooz.store import SnoozStateStore
@@ -11,8 +13,12 @@ SUPPORTS_FAN = SnoozAdvertisementData(
 )
 
 
-def test_patch():
-    store = SnoozStateStore(SUPPORTS_FAN)
+@pytest.mark.parametrize(
+    "adv_data", [SUPPORTS_FAN, DOESNT_SUPPORT_FAN], ids=["breez", "original"]
+)
+def test_patch(adv_data: SnoozAdvertisementData) -> None:
+    supports_fan = adv_data is SUPPORTS_FAN
+    store = SnoozStateStore(adv_data)
     assert store.current == SnoozDeviceState()
 
     initial_state = SnoozDeviceState(on=True, volume=10)
@@ -24,27 +30,11 @@ def test_patch():
     assert store.patch(new_state) is True
     assert store.current.volume is initial_state.volume
     assert store.current.on is new_state.on
-    assert store.current.fan_speed is new_state.fan_speed
+    assert store.current.fan_speed is (new_state.fan_speed if supports_fan else None)
 
     assert store.patch(new_state) is False
 
-
-def test_patch_unsupported_props():
-    store = SnoozStateStore(DOESNT_SUPPORT_FAN)
-
-    assert store.current == SnoozDeviceState()
-
-    initial_state = SnoozDeviceState(on=True, volume=10)
-    assert store.patch(initial_state) is True
-
-    assert store.current == initial_state
-
-    new_state = SnoozDeviceState(on=False, fan_speed=50)
-    assert store.patch(new_state) is True
-    assert store.current.volume is initial_state.volume
-    assert store.current.on is new_state.on
-    assert store.current.fan_speed is None
-
+    # fan props are only kept for devices that have a fan
     assert (
         store.patch(
             SnoozDeviceState(
@@ -55,10 +45,17 @@ def test_patch_unsupported_props():
                 target_temperature=68,
             )
         )
-        is False
+        is supports_fan
     )
-    assert store.current.fan_on is None
-    assert store.current.fan_speed is None
-    assert store.current.fan_auto_enabled is None
-    assert store.current.temperature is None
-    assert store.current.target_temperature is None
+    if not supports_fan:
+        assert store.current.fan_on is None
+        assert store.current.fan_speed is None
+        assert store.current.fan_auto_enabled is None
+        assert store.current.temperature is None
+        assert store.current.target_temperature is None
+    else:
+        assert store.current.fan_on is True
+        assert store.current.fan_speed == 33
+        assert store.current.fan_auto_enabled is True
+        assert store.current.temperature == 69
+        assert store.current.target_temperature == 68
@@ -1,5 +1,7 @@
 # mypy: warn_unreachable=False
 
+from unittest.mock import ANY, call
+
 import pytest
 from bleak import BLEDevice
 from pytest_mock import MockerFixture
@@ -20,13 +22,35 @@ from pysnooz.model import (
 )
 from pysnooz.testing import MockSnoozClient, MockSnoozDevice
 
-from . import SUPPORTED_MODELS
+from . import SUPPORTED_MODEL_PARAMS
 
 TEST_BLE_DEVICE = BLEDevice("00:00:00:00:AB:CD", "Snooz-ABCD", [], 0)
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("model", SUPPORTED_MODELS)
+class Contains:
+    """Equal to any bytes that contain (or, if present is False, lack) a value."""
+
+    __slots__ = ("value", "present")
+
+    def __init__(self, value: int, present: bool = True) -> None:
+        self.value = value
+        self.present = present
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (bytes, bytearray)):
+            return NotImplemented
+        return (self.value in other) is self.present
+
+    def __repr__(self) -> str:
+        return f"Contains({self.value}, present={self.present})"
+
+
+# the mock copies any state it's given, so these can be shared between tests
+STATE_ON_32 = SnoozDeviceState(on=True, volume=32)
+STATE_OFF_45 = SnoozDeviceState(on=False, volume=45)
+
+
+@SUPPORTED_MODEL_PARAMS
 async def test_mock_client(mocker: MockerFixture, model: SnoozDeviceModel) -> None:
     on_disconnect = mocker.stub()
     client = MockSnoozClient(
@@ -64,12 +88,8 @@ async def test_mock_client(mocker: MockerFixture, model: SnoozDeviceModel) -> No
         await client.start_notify(write_state_char, mocker.stub())
 
     await client.start_notify(read_state_char, state_callback)
-    await client.write_gatt_char(write_state_char, bytes([Command.MOTOR_SPEED, 15]))
-
-    state_callback.assert_called_once()
     # when not authenticated, the state shouldn't be updated
-    assert 15 not in state_callback.call_args[0][1]
-    state_callback.reset_mock()
+    await client.write_gatt_char(write_state_char, bytes([Command.MOTOR_SPEED, 15]))
 
     await client.write_gatt_char(
         write_state_char,
@@ -85,13 +105,15 @@ async def test_mock_client(mocker: MockerFixture, model: SnoozDeviceModel) -> No
         await client.write_gatt_char(write_state_char, bytes([0xFF]))
 
     await client.write_gatt_char(write_state_char, bytes([Command.MOTOR_SPEED, 15]))
-    state_callback.assert_called_once()
-    assert 15 in state_callback.call_args[0][1]
-    state_callback.reset_mock()
 
     await client.stop_notify(read_state_char)
     await client.write_gatt_char(write_state_char, bytes([Command.MOTOR_SPEED, 15]))
-    state_callback.assert_not_called()
+
+    # one update before authenticating, one after and none once unsubscribed
+    assert state_callback.call_args_list == [
+        call(ANY, Contains(15, present=False)),
+        call(ANY, Contains(15)),
+    ]
 
     if model == SnoozDeviceModel.BREEZ:
         on_command_response = mocker.stub()
@@ -119,8 +141,7 @@ async def test_mock_client(mocker: MockerFixture, model: SnoozDeviceModel) -> No
     assert client.is_connected is True
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("model", SUPPORTED_MODELS)
+@SUPPORTED_MODEL_PARAMS
 async def test_mock_device(mocker: MockerFixture, model: SnoozDeviceModel) -> None:
     adv_data = SnoozAdvertisementData(
         model,
@@ -135,7 +156,7 @@ async def test_mock_device(mocker: MockerFixture, model: SnoozDeviceModel) -> No
 
     # should do nothing
     device.trigger_disconnect()
-    device.trigger_state(SnoozDeviceState(on=True, volume=32))
+    device.trigger_state(STATE_ON_32)
     device.trigger_temperature(72.5)
 
     on_state_change = mocker.stub()
@@ -145,14 +166,14 @@ async def test_mock_device(mocker: MockerFixture, model: SnoozDeviceModel) -> No
     assert result.status == SnoozCommandResultStatus.SUCCESSFUL
     assert device.is_connected is True
 
-    device.trigger_state(SnoozDeviceState(on=True, volume=32))
+    device.trigger_state(STATE_ON_32)
 
     on_state_change.assert_called()
     assert device.state.on is True
     assert device.state.volume == 32
     on_state_change.reset_mock()
 
-    device.trigger_state(SnoozDeviceState(on=False, volume=45))
+    device.trigger_state(STATE_OFF_45)
     on_state_change.assert_called()
     assert device.state.on is False
     assert device.state.volume == 45
@@ -1,38 +1,60 @@
 import asyncio
 from datetime import timedelta
-from unittest.mock import call
+from unittest.mock import AsyncMock, call
 
 import pytest
-from pytest_mock import MockerFixture
 
 from pysnooz.transition import Transition
 
+# every test in this module runs transitions against the fake clock
+pytestmark = pytest.mark.usefixtures("module_mock_sleep")
 
-@pytest.mark.asyncio
+Stubs = tuple[AsyncMock, AsyncMock]
+
+
+@pytest.fixture(scope="module")
+def module_stubs() -> Stubs:
+    return AsyncMock(name="on_update"), AsyncMock(name="on_complete")
+
+
+@pytest.fixture
+def stubs(module_stubs: Stubs) -> Stubs:
+    """Reuse the module's on_update and on_complete stubs with a clean slate."""
+    for stub in module_stubs:
+        stub.reset_mock(side_effect=True)
+    return module_stubs
+
+
+@pytest.fixture
+def coarse_updates(monkeypatch: pytest.MonkeyPatch) -> None:
+    # the start and end values are all that matter for these tests, so take
+    # bigger steps through the fake clock and make fewer on_update calls. steps
+    # stay under a second so the transition's elapsed time correction is unused
+    monkeypatch.setattr("pysnooz.transition.UPDATES_PER_SECOND", 2)
+
+
+@pytest.mark.usefixtures("coarse_updates")
 async def test_increasing_value(
-    mocker: MockerFixture, event_loop: asyncio.AbstractEventLoop, mock_sleep: None
+    stubs: Stubs, event_loop: asyncio.AbstractEventLoop
 ) -> None:
-    await _standard_transition_test(0, 31, timedelta(seconds=30), mocker, event_loop)
+    await _standard_transition_test(0, 31, timedelta(seconds=30), stubs, event_loop)
 
 
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("coarse_updates")
 async def test_decreasing_value(
-    mocker: MockerFixture, event_loop: asyncio.AbstractEventLoop, mock_sleep: None
+    stubs: Stubs, event_loop: asyncio.AbstractEventLoop
 ) -> None:
-    await _standard_transition_test(94, 15, timedelta(seconds=30), mocker, event_loop)
+    await _standard_transition_test(94, 15, timedelta(seconds=30), stubs, event_loop)
 
 
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("coarse_updates")
 async def test_short_duration(
-    mocker: MockerFixture, event_loop: asyncio.AbstractEventLoop, mock_sleep: None
+    stubs: Stubs, event_loop: asyncio.AbstractEventLoop
 ) -> None:
-    await _standard_transition_test(100, 250, timedelta(seconds=1), mocker, event_loop)
+    await _standard_transition_test(100, 250, timedelta(seconds=1), stubs, event_loop)
 
 
-@pytest.mark.asyncio
-async def test_cancel(
-    mocker: MockerFixture, event_loop: asyncio.AbstractEventLoop, mock_sleep: None
-) -> None:
+async def test_cancel(stubs: Stubs, event_loop: asyncio.AbstractEventLoop) -> None:
     transition = Transition()
 
     start_value = 0
@@ -43,11 +65,9 @@ async def test_cancel(
         if value >= cancel_after_value:
             transition.cancel()
 
-    on_update = mocker.async_stub(name="on_update")
+    on_update, on_complete = stubs
     on_update.side_effect = update_side_effect
 
-    on_complete = mocker.async_stub(name="on_complete")
-
     with pytest.raises(asyncio.CancelledError):
         await transition.async_run(
             event_loop,
@@ -72,16 +92,13 @@ async def _standard_transition_test(
     start_value: float,
     end_value: float,
     duration: timedelta,
-    mocker: MockerFixture,
+    stubs: Stubs,
     event_loop: asyncio.AbstractEventLoop,
 ) -> None:
     transition = Transition()
 
-    on_update = mocker.async_stub(name="on_update")
-    on_complete = mocker.async_stub(name="on_complete")
+    on_update, on_complete = stubs
 
-    start_value = 94
-    end_value = 15
     await transition.async_run(
         event_loop,
         start_value,